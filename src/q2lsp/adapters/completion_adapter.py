@@ -11,6 +11,7 @@ from q2lsp.core.types import (
     CompletionKind,
     CompletionItem,
     CompletionMode,
+    CompletionModeName,
     CompletionQuery,
     ParameterCandidate,
 )
@@ -78,7 +79,7 @@ def to_completion_data(catalog: QiimeCatalog) -> CompletionData:
     return CompletionData(root_items=tuple(root_items), commands=tuple(commands))
 
 
-def get_used_parameters(command_tokens: tuple[str, ...] | ParsedCommand) -> set[str]:
+def get_used_parameters(command_tokens: tuple[str, ...]) -> set[str]:
     """Extract normalized parameter names from command tokens."""
     used: set[str] = set()
     option_groups = _group_command_options(command_tokens)
@@ -94,7 +95,7 @@ def option_matches_prefix(option_name: str, prefix_filter: str) -> bool:
     return option_label_matches_prefix(option_name, prefix_filter)
 
 
-def _to_completion_mode(mode: str) -> CompletionMode:
+def _to_completion_mode(mode: str) -> CompletionModeName:
     if mode == CompletionMode.ROOT:
         return CompletionMode.ROOT
     if mode == CompletionMode.PLUGIN:
@@ -104,6 +105,12 @@ def _to_completion_mode(mode: str) -> CompletionMode:
     return CompletionMode.NONE
 
 
+def _group_command_options(
+    command_tokens: tuple[str, ...],
+) -> tuple[OptionGroup[str], ...]:
+    return group_option_tokens(command_tokens, lambda token: token, start_index=3)
+
+
 def _get_token_text(command_tokens: tuple[str, ...], index: int) -> str:
     if index >= len(command_tokens):
         return ""
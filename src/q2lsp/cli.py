@@ -132,6 +132,7 @@ def run(argv: Sequence[str] | None = None) -> int:
         server = create_server(
             get_hierarchy=get_hierarchy,
             get_help=get_help,
+            warm_catalog=True,
         )
 
         # Start appropriate transport
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from typing import TypeVar
+
 from q2lsp.core.types import (
     ActionCandidate,
     CommandCandidate,
@@ -10,8 +14,12 @@ from q2lsp.core.types import (
     CompletionKind,
     CompletionMode,
     CompletionQuery,
+    LabelIndex,
+    ParameterCandidate,
 )
 
+_T = TypeVar("_T")
+
 
 def get_completions(
     query: CompletionQuery,
@@ -38,8 +46,54 @@ def get_completions(
     return []
 
 
+def index_completion_data(data: CompletionData) -> CompletionData:
+    """Return data carrying sorted label indexes for its candidates.
+
+    Root items, the actions of each command and the parameters of each action
+    are indexed. Prefix lookups on indexed data cost a binary search plus the
+    number of matches; data without indexes is scanned linearly.
+    """
+    return data._replace(
+        root_index=build_label_index(data.root_items, _item_labels),
+        commands=tuple(
+            command._replace(
+                actions=tuple(_index_action(action) for action in command.actions),
+                action_index=build_label_index(command.actions, _action_labels),
+            )
+            for command in data.commands
+        ),
+    )
+
+
+def _index_action(action: ActionCandidate) -> ActionCandidate:
+    return action._replace(
+        parameter_index=build_label_index(action.parameters, _parameter_labels),
+        match_text_index=build_label_index(action.parameters, _parameter_match_texts),
+    )
+
+
+def build_label_index(
+    candidates: Iterable[_T], labels: Callable[[_T], Iterable[str]]
+) -> LabelIndex:
+    """Sort every label of the candidates, remembering where each came from."""
+    entries = sorted(
+        (label, position)
+        for position, candidate in enumerate(candidates)
+        for label in labels(candidate)
+    )
+    return LabelIndex(
+        sorted_labels=tuple(label for label, _ in entries),
+        positions=tuple(position for _, position in entries),
+    )
+
+
 def complete_root(data: CompletionData, prefix: str) -> list[CompletionItem]:
-    return [item for item in data.root_items if item.label.startswith(prefix)]
+    return [
+        data.root_items[position]
+        for position in _prefix_positions(
+            data.root_items, _item_labels, prefix, data.root_index
+        )
+    ]
 
 
 def complete_plugin(
@@ -52,9 +106,10 @@ def complete_plugin(
         return []
 
     items = [
-        action.item
-        for action in command.actions
-        if action.item.label.startswith(prefix)
+        command.actions[position].item
+        for position in _prefix_positions(
+            command.actions, _action_labels, prefix, command.action_index
+        )
     ]
     if not items and command.is_builtin:
         return _complete_builtin_options(prefix)
@@ -98,18 +153,31 @@ def complete_parameters(
             return _complete_builtin_options(prefix)
         return []
 
-    items: list[CompletionItem] = []
-    for parameter in action.parameters:
-        if parameter.name in used_params:
-            continue
-        if not _parameter_matches_prefix(
-            parameter.match_texts,
-            parameter.item.label,
-            prefix,
-            normalized_prefix,
-        ):
-            continue
-        items.append(parameter.item)
+    # A parameter matches when its label starts with the typed prefix or one
+    # of its precomputed match texts starts with the normalized prefix; both
+    # are answered by range lookups in sorted label indexes.
+    parameters = action.parameters
+    positions = _prefix_positions(
+        parameters, _parameter_labels, prefix, action.parameter_index
+    )
+    normalized = normalized_prefix or prefix.lstrip("-")
+    if prefix and normalized:
+        positions = sorted(
+            {
+                *positions,
+                *_prefix_positions(
+                    parameters,
+                    _parameter_match_texts,
+                    normalized,
+                    action.match_text_index,
+                ),
+            }
+        )
+    items = [
+        parameters[position].item
+        for position in positions
+        if parameters[position].name not in used_params
+    ]
 
     if "--help".startswith(prefix) and "help" not in used_params:
         items.append(
@@ -123,6 +191,52 @@ def complete_parameters(
     return items
 
 
+def _item_labels(item: CompletionItem) -> tuple[str]:
+    return (item.label,)
+
+
+def _action_labels(action: ActionCandidate) -> tuple[str]:
+    return (action.item.label,)
+
+
+def _parameter_labels(parameter: ParameterCandidate) -> tuple[str]:
+    return (parameter.item.label,)
+
+
+def _parameter_match_texts(parameter: ParameterCandidate) -> tuple[str, ...]:
+    return parameter.match_texts
+
+
+def _prefix_positions(
+    candidates: Sequence[_T],
+    labels: Callable[[_T], Iterable[str]],
+    prefix: str,
+    index: LabelIndex | None,
+) -> list[int]:
+    """Positions of candidates with a label starting with prefix, in input order.
+
+    With an index, a lookup costs a binary search plus the number of matches
+    instead of a scan over every label.
+    """
+    if not prefix:
+        return list(range(len(candidates)))
+
+    if index is None:
+        return [
+            position
+            for position, candidate in enumerate(candidates)
+            if any(label.startswith(prefix) for label in labels(candidate))
+        ]
+
+    sorted_labels = index.sorted_labels
+    matches: set[int] = set()
+    i = bisect_left(sorted_labels, prefix)
+    while i < len(sorted_labels) and sorted_labels[i].startswith(prefix):
+        matches.add(index.positions[i])
+        i += 1
+    return sorted(matches)
+
+
 def _find_command(
     commands: tuple[CommandCandidate, ...],
     name: str,
@@ -141,20 +255,3 @@ def _find_action(
         if action.item.label == name:
             return action
     return None
-
-
-def _parameter_matches_prefix(
-    match_texts: tuple[str, ...],
-    option_label: str,
-    prefix: str,
-    normalized_prefix: str,
-) -> bool:
-    if not prefix:
-        return True
-    if option_label.startswith(prefix):
-        return True
-
-    normalized = normalized_prefix or prefix.lstrip("-")
-    if not normalized:
-        return False
-    return any(text.startswith(normalized) for text in match_texts)
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import re
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import cached_property
+
+_LINE_BREAK_RE = re.compile(r"\r\n|\r|\n")
 
 
 @dataclass(frozen=True)
@@ -21,33 +27,41 @@ class OffsetMapper:
 
     text: str
 
+    @cached_property
+    def _line_table(self) -> tuple[array[int], array[int]]:
+        """Start offsets and content end offsets of every line, built once."""
+        starts = array("q", [0])
+        ends = array("q")
+        for line_break in _LINE_BREAK_RE.finditer(self.text):
+            ends.append(line_break.start())
+            starts.append(line_break.end())
+        ends.append(len(self.text))
+        return starts, ends
+
     def offset_to_position(self, offset: int) -> tuple[int, int]:
         safe_offset = max(0, min(offset, len(self.text)))
-        line = 0
-        character = 0
-        current_offset = 0
-        while current_offset < safe_offset:
-            char = self.text[current_offset]
-            next_offset = current_offset + 1
-            if char == "\r" and next_offset < len(self.text) and self.text[next_offset] == "\n":
-                if safe_offset <= next_offset:
-                    return line, character
-                line += 1
-                character = 0
-                current_offset += 2
-            elif char == "\r" or char == "\n":
-                line += 1
-                character = 0
-                current_offset = next_offset
-            else:
-                character += _utf16_length(char)
-                current_offset = next_offset
-        return line, character
+        starts, ends = self._line_table
+        line = bisect_right(starts, safe_offset) - 1
+        line_start = starts[line]
+        # An offset between "\r" and "\n" stays at the end of its line.
+        line_offset = min(safe_offset, ends[line])
+        if self.text.isascii():
+            return line, line_offset - line_start
+        return line, _utf16_length(self.text[line_start:line_offset])
 
     def position_to_offset(self, line: int, character: int) -> int:
-        line_start, line_end = _line_bounds(self.text, max(0, line))
+        starts, ends = self._line_table
+        target_line = max(0, line)
+        if target_line >= len(starts):
+            return len(self.text)
+        line_start = starts[target_line]
+        line_end = ends[target_line]
 
         target_units = max(0, character)
+        if self.text.isascii():
+            # One UTF-16 code unit per character: no per-character walk needed.
+            return min(line_start + target_units, line_end)
+
         units = 0
         for offset in range(line_start, line_end):
             next_units = units + _utf16_length(self.text[offset])
@@ -59,29 +73,3 @@ class OffsetMapper:
 
 def _utf16_length(text: str) -> int:
     return len(text.encode("utf-16-le")) // 2
-
-
-def _line_bounds(text: str, target_line: int) -> tuple[int, int]:
-    line = 0
-    line_start = 0
-    current_offset = 0
-    while current_offset < len(text):
-        char = text[current_offset]
-        if char == "\r" and current_offset + 1 < len(text) and text[current_offset + 1] == "\n":
-            if line == target_line:
-                return line_start, current_offset
-            line += 1
-            current_offset += 2
-            line_start = current_offset
-        elif char == "\r" or char == "\n":
-            if line == target_line:
-                return line_start, current_offset
-            line += 1
-            current_offset += 1
-            line_start = current_offset
-        else:
-            current_offset += 1
-
-    if line == target_line:
-        return line_start, len(text)
-    return len(text), len(text)
@@ -2,39 +2,42 @@
 
 from __future__ import annotations
 
-from enum import Enum
-from typing import NamedTuple
+from typing import Final, Literal, NamedTuple, TypeAlias
 
+CompletionModeName: TypeAlias = Literal["root", "plugin", "parameter", "none"]
+CompletionKindName: TypeAlias = Literal["plugin", "action", "parameter", "builtin"]
 
-class _StrEnum(str, Enum):
-    """String-valued enum that behaves like str at runtime."""
 
-    def __str__(self) -> str:
-        return str(self.value)
+class CompletionMode:
+    """Mode determines what kind of completions to offer.
 
+    Members are plain (interned) str constants, so mode checks are ordinary
+    string comparisons. Annotate mode values with CompletionModeName.
+    """
 
-class CompletionMode(_StrEnum):
-    """Mode determines what kind of completions to offer."""
+    ROOT: Final = "root"
+    PLUGIN: Final = "plugin"
+    PARAMETER: Final = "parameter"
+    NONE: Final = "none"
 
-    ROOT = "root"
-    PLUGIN = "plugin"
-    PARAMETER = "parameter"
-    NONE = "none"
 
+class CompletionKind:
+    """Kind categorizes completion items.
 
-class CompletionKind(_StrEnum):
-    """Kind categorizes completion items."""
+    Members are plain str constants; annotate kind values with
+    CompletionKindName.
+    """
 
-    PLUGIN = "plugin"
-    ACTION = "action"
-    PARAMETER = "parameter"
-    BUILTIN = "builtin"
+    PLUGIN: Final = "plugin"
+    ACTION: Final = "action"
+    PARAMETER: Final = "parameter"
+    BUILTIN: Final = "builtin"
 
 
 class CompletionQuery(NamedTuple):
     """Pure input for completion decisions."""
 
-    mode: CompletionMode
+    mode: CompletionModeName
     prefix: str
     normalized_prefix: str = ""
     plugin_name: str = ""
@@ -47,10 +50,21 @@ class CompletionItem(NamedTuple):
 
     label: str
     detail: str
-    kind: CompletionKind
+    kind: CompletionKindName
     insert_text: str | None = None
 
 
+class LabelIndex(NamedTuple):
+    """Candidate labels sorted once for prefix range lookups.
+
+    A candidate may contribute several labels; ``positions[i]`` is the
+    position of the candidate that ``sorted_labels[i]`` came from.
+    """
+
+    sorted_labels: tuple[str, ...] = ()
+    positions: tuple[int, ...] = ()
+
+
 class ParameterCandidate(NamedTuple):
     """Normalized parameter data used by completion filtering."""
 
@@ -64,6 +78,8 @@ class ActionCandidate(NamedTuple):
 
     item: CompletionItem
     parameters: tuple[ParameterCandidate, ...] = ()
+    parameter_index: LabelIndex | None = None
+    match_text_index: LabelIndex | None = None
 
 
 class CommandCandidate(NamedTuple):
@@ -72,6 +88,7 @@ class CommandCandidate(NamedTuple):
     name: str
     is_builtin: bool
     actions: tuple[ActionCandidate, ...] = ()
+    action_index: LabelIndex | None = None
 
 
 class CompletionData(NamedTuple):
@@ -79,3 +96,4 @@ class CompletionData(NamedTuple):
 
     root_items: tuple[CompletionItem, ...] = ()
     commands: tuple[CommandCandidate, ...] = ()
+    root_index: LabelIndex | None = None
@@ -1,6 +1,6 @@
 """LSP types for QIIME 2 language server."""
 
-from q2lsp.core.types import CompletionItem
+from q2lsp.core.types import CompletionItem, CompletionMode
 from q2lsp.lsp.document_commands import (
     AnalyzedDocument,
     analyze_document,
@@ -8,7 +8,6 @@ from q2lsp.lsp.document_commands import (
 )
 from q2lsp.lsp.types import (
     CompletionContext,
-    CompletionMode,
     ParsedCommand,
     TokenSpan,
 )
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import TypeAlias
+
 from lsprotocol import types
 from pygls.workspace import TextDocument
 
-from q2lsp.core.document import DocumentSnapshot
+from q2lsp.core.document import DocumentSnapshot, OffsetMapper
 from q2lsp.core.types import (
     CompletionItem as InternalCompletionItem,
     CompletionKind,
@@ -14,9 +19,12 @@ from q2lsp.core.types import (
 __all__ = [
     "LSP_POSITION_ENCODING",
     "completion_kind_to_lsp",
+    "make_cached_completion_items_converter",
+    "make_cached_offset_mapper",
     "offset_to_position",
     "position_to_offset",
     "to_lsp_completion_item",
+    "to_lsp_completion_items",
 ]
 
 LSP_POSITION_ENCODING = types.PositionEncodingKind.Utf16
@@ -27,36 +35,60 @@ _COMPLETION_KIND_TO_LSP: dict[str, types.CompletionItemKind] = {
     CompletionKind.PARAMETER: types.CompletionItemKind.Field,
     CompletionKind.BUILTIN: types.CompletionItemKind.Class,
 }
+_DEFAULT_COMPLETION_KIND = types.CompletionItemKind.Text
+
+_RangeKey: TypeAlias = tuple[int, int, int]
+
+CompletionItemsConverter: TypeAlias = Callable[
+    [Iterable[InternalCompletionItem], "types.Position | None", str],
+    list[types.CompletionItem],
+]
+
+OffsetMapperProvider: TypeAlias = Callable[[TextDocument], OffsetMapper]
 
 
-def position_to_offset(document: TextDocument, position: types.Position) -> int:
+def position_to_offset(
+    document: TextDocument,
+    position: types.Position,
+    *,
+    mapper: OffsetMapper | None = None,
+) -> int:
     """
     Convert LSP Position (line, character) to document offset.
 
     Args:
         document: The text document
         position: LSP position with 0-based line and character
+        mapper: Offset mapper of the document's current text to reuse (optional)
 
     Returns:
         0-based offset in the document
     """
-    snapshot = _document_snapshot(document)
-    return snapshot.offset_mapper().position_to_offset(position.line, position.character)
+    if mapper is None:
+        mapper = _document_snapshot(document).offset_mapper()
+    return mapper.position_to_offset(position.line, position.character)
 
 
-def offset_to_position(document: TextDocument, offset: int) -> types.Position:
+def offset_to_position(
+    document: TextDocument,
+    offset: int,
+    *,
+    mapper: OffsetMapper | None = None,
+) -> types.Position:
     """
     Convert document offset to LSP Position (line, character).
 
     Args:
         document: The text document
         offset: 0-based offset in the document
+        mapper: Offset mapper of the document's current text to reuse (optional)
 
     Returns:
         LSP Position with 0-based line and character
     """
-    snapshot = _document_snapshot(document)
-    line, character = snapshot.offset_mapper().offset_to_position(offset)
+    if mapper is None:
+        mapper = _document_snapshot(document).offset_mapper()
+    line, character = mapper.offset_to_position(offset)
     return types.Position(line=line, character=character)
 
 
@@ -64,7 +96,39 @@ def _document_snapshot(document: TextDocument) -> DocumentSnapshot:
     return DocumentSnapshot(uri=document.uri, text=document.source, version=document.version)
 
 
-def completion_kind_to_lsp(kind: CompletionKind | str) -> types.CompletionItemKind:
+def make_cached_offset_mapper(*, maxsize: int = 64) -> OffsetMapperProvider:
+    """Create a provider that reuses offset mappers of unchanged documents.
+
+    Building a mapper scans the whole text for line breaks, so the mapper of
+    each document is kept, keyed by URI, until its text changes. At most
+    ``maxsize`` documents are kept (least recently used first out).
+
+    Thread-safe: the cache may be shared by concurrent callers.
+    """
+    cache: OrderedDict[str, OffsetMapper] = OrderedDict()
+    lock = threading.Lock()
+
+    def get_offset_mapper(document: TextDocument) -> OffsetMapper:
+        uri = document.uri
+        source = document.source
+        with lock:
+            mapper = cache.get(uri)
+            if mapper is not None and mapper.text == source:
+                cache.move_to_end(uri)
+                return mapper
+
+        mapper = _document_snapshot(document).offset_mapper()
+        with lock:
+            cache[uri] = mapper
+            cache.move_to_end(uri)
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+        return mapper
+
+    return get_offset_mapper
+
+
+def completion_kind_to_lsp(kind: str) -> types.CompletionItemKind:
     """
     Map internal CompletionKind to LSP CompletionItemKind.
 
@@ -74,7 +138,7 @@ def completion_kind_to_lsp(kind: CompletionKind | str) -> types.CompletionItemKi
     Returns:
         LSP CompletionItemKind enum value
     """
-    return _COMPLETION_KIND_TO_LSP.get(str(kind), types.CompletionItemKind.Text)
+    return _COMPLETION_KIND_TO_LSP.get(kind, _DEFAULT_COMPLETION_KIND)
 
 
 def to_lsp_completion_item(
@@ -93,23 +157,119 @@ def to_lsp_completion_item(
     Returns:
         LSP-compatible CompletionItem
     """
-    completion_item = types.CompletionItem(
+    return _build_completion_item(item, _replace_range(position, prefix))
+
+
+def to_lsp_completion_items(
+    items: Iterable[InternalCompletionItem],
+    position: types.Position | None = None,
+    prefix: str = "",
+) -> list[types.CompletionItem]:
+    """
+    Convert internal CompletionItems to LSP CompletionItems in one batch.
+
+    Every item in a completion response replaces the same prefix, so the
+    text_edit range is built once and shared instead of per item.
+
+    Args:
+        items: Internal completion items
+        position: LSP position where completion is requested (optional)
+        prefix: Text prefix to be replaced by text_edit (optional)
+
+    Returns:
+        LSP-compatible CompletionItems in input order
+    """
+    replace_range = _replace_range(position, prefix)
+    return [_build_completion_item(item, replace_range) for item in items]
+
+
+def make_cached_completion_items_converter(
+    *, maxsize: int = 2048
+) -> CompletionItemsConverter:
+    """Create a to_lsp_completion_items variant that reuses converted items.
+
+    Repeated completion requests at the same spot (re-triggered completion,
+    an empty prefix after ``qiime``, backspacing over a prefix) return the
+    same internal items with the same replace range. Each converted LSP item
+    is kept, keyed by the internal item and that range, so such responses
+    reuse it instead of rebuilding the validated attrs objects. Cached items
+    are shared between responses and must be treated as read-only. At most
+    ``maxsize`` items are kept (least recently used first out).
+
+    Thread-safe: the cache may be shared by concurrent callers.
+    """
+    cache: OrderedDict[
+        tuple[InternalCompletionItem, _RangeKey | None], types.CompletionItem
+    ] = OrderedDict()
+    lock = threading.Lock()
+
+    def convert(
+        items: Iterable[InternalCompletionItem],
+        position: types.Position | None = None,
+        prefix: str = "",
+    ) -> list[types.CompletionItem]:
+        range_key = _replace_range_key(position, prefix)
+        replace_range: types.Range | None = None
+        lsp_items: list[types.CompletionItem] = []
+        with lock:
+            for item in items:
+                key = (item, range_key)
+                lsp_item = cache.get(key)
+                if lsp_item is None:
+                    if replace_range is None and range_key is not None:
+                        replace_range = _range_from_key(range_key)
+                    lsp_item = _build_completion_item(item, replace_range)
+                    cache[key] = lsp_item
+                else:
+                    cache.move_to_end(key)
+                lsp_items.append(lsp_item)
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+        return lsp_items
+
+    return convert
+
+
+def _replace_range_key(
+    position: types.Position | None, prefix: str
+) -> _RangeKey | None:
+    """(line, start, end) of the typed prefix, or None when no text_edit is needed."""
+    if position is None or not prefix:
+        return None
+    start_character = max(0, position.character - len(prefix))
+    return (position.line, start_character, position.character)
+
+
+def _range_from_key(range_key: _RangeKey) -> types.Range:
+    line, start_character, end_character = range_key
+    return types.Range(
+        start=types.Position(line=line, character=start_character),
+        end=types.Position(line=line, character=end_character),
+    )
+
+
+def _replace_range(
+    position: types.Position | None, prefix: str
+) -> types.Range | None:
+    """Range covering the typed prefix, or None when no text_edit is needed."""
+    range_key = _replace_range_key(position, prefix)
+    if range_key is None:
+        return None
+    return _range_from_key(range_key)
+
+
+def _build_completion_item(
+    item: InternalCompletionItem, replace_range: types.Range | None
+) -> types.CompletionItem:
+    insert_text = item.insert_text if item.insert_text else None
+    return types.CompletionItem(
         label=item.label,
         detail=item.detail,
-        kind=completion_kind_to_lsp(item.kind),
-        insert_text=item.insert_text if item.insert_text else None,
+        kind=_COMPLETION_KIND_TO_LSP.get(item.kind, _DEFAULT_COMPLETION_KIND),
+        insert_text=insert_text,
+        text_edit=(
+            types.TextEdit(range=replace_range, new_text=insert_text or item.label)
+            if replace_range is not None
+            else None
+        ),
     )
-
-    # If position and prefix are provided, add text_edit to replace the prefix
-    if position is not None and prefix:
-        start_character = max(0, position.character - len(prefix))
-        new_text = item.insert_text if item.insert_text else item.label
-        completion_item.text_edit = types.TextEdit(
-            range=types.Range(
-                start=types.Position(line=position.line, character=start_character),
-                end=types.Position(line=position.line, character=position.character),
-            ),
-            new_text=new_text,
-        )
-
-    return completion_item
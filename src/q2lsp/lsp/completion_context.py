@@ -6,14 +6,20 @@ what type of completion is needed at a given cursor position.
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections.abc import Sequence
 
+from q2lsp.core.types import CompletionMode
 from q2lsp.lsp.parser import (
-    command_at_position,
     find_qiime_commands,
     merge_line_continuations,
 )
-from q2lsp.lsp.types import CompletionContext, CompletionMode, ParsedCommand, TokenSpan
+from q2lsp.lsp.types import (
+    CompletionContext,
+    CompletionModeName,
+    ParsedCommand,
+    TokenSpan,
+)
 
 
 def get_completion_context(text: str, offset: int) -> CompletionContext:
@@ -36,6 +42,21 @@ def get_completion_context(text: str, offset: int) -> CompletionContext:
     return get_context_from_merged(merged_text, merged_offset, commands)
 
 
+def _command_containing(
+    commands: Sequence[ParsedCommand], offset: int
+) -> ParsedCommand | None:
+    """Binary-search the start-ordered, non-overlapping commands for offset."""
+    index = bisect_right(commands, offset, key=_command_start) - 1
+    if index < 0:
+        return None
+    command = commands[index]
+    return command if offset < command.end else None
+
+
+def _command_start(command: ParsedCommand) -> int:
+    return command.start
+
+
 def get_context_from_merged(
     merged_text: str,
     merged_offset: int,
@@ -56,9 +77,9 @@ def get_context_from_merged(
     Returns:
         CompletionContext with mode, command, current token, etc.
     """
-    command = command_at_position(list(commands), merged_offset)
+    command = _command_containing(commands, merged_offset)
     if command is None and merged_offset == len(merged_text) and merged_offset > 0:
-        command = command_at_position(list(commands), merged_offset - 1)
+        command = _command_containing(commands, merged_offset - 1)
 
     if command is None:
         return CompletionContext(
@@ -104,7 +125,7 @@ def get_context_from_merged(
     )
 
 
-def _original_to_merged_offset(original_offset: int, offset_map: list[int]) -> int:
+def _original_to_merged_offset(original_offset: int, offset_map: Sequence[int]) -> int:
     """Convert original text offset to merged text offset."""
     for merged_idx, orig_idx in enumerate(offset_map):
         if orig_idx >= original_offset:
@@ -112,7 +133,7 @@ def _original_to_merged_offset(original_offset: int, offset_map: list[int]) -> i
     return len(offset_map) - 1
 
 
-def _determine_mode(token_index: int) -> CompletionMode:
+def _determine_mode(token_index: int) -> CompletionModeName:
     """
     Determine completion mode based on token position.
 
@@ -13,6 +13,7 @@ from q2lsp.lsp.diagnostics.stages import _has_help_invocation
 from q2lsp.lsp.diagnostics.validator import validate_command
 from q2lsp.lsp.types import ParsedCommand, TokenSpan
 from q2lsp.qiime.options import OptionGroup
+from q2lsp.qiime.signature_params import build_action_signature
 from q2lsp.qiime.types import CommandHierarchy, JsonObject
 
 
@@ -32,7 +33,9 @@ def analyze_command(
 
     option_tokens = command.tokens[3:]
     option_groups = command.options
-    if _has_help_invocation(option_tokens, option_groups, action_node):
+    if _has_help_invocation(
+        option_tokens, option_groups, build_action_signature(action_node)
+    ):
         return CommandAnalysis(
             command=command,
             issues=issues,
@@ -9,25 +9,21 @@ from q2lsp.lsp.diagnostics.matching import (
 from q2lsp.lsp.types import TokenSpan
 from q2lsp.qiime.catalog import QiimeCatalog
 from q2lsp.qiime.options import (
-    format_qiime_option_label,
     group_option_tokens,
     normalize_option_to_param_name,
     OptionGroup,
-    param_is_required,
 )
 from q2lsp.qiime.signature_params import (
-    get_all_option_labels,
-    iter_signature_params,
+    ActionSignature,
+    signature_param_is_bool_flag,
 )
-from q2lsp.qiime.types import JsonObject
 
 
 def _validate_plugin_or_builtin_with_catalog(
     token: TokenSpan, catalog: QiimeCatalog
 ) -> DiagnosticIssue | None:
     token_text = token.text
-    valid_plugins, valid_builtins = catalog.valid_plugins_and_builtins()
-    all_valid_names = list(valid_plugins | valid_builtins)
+    all_valid_names = catalog.valid_root_command_names()
 
     if _is_exact_match(token_text, all_valid_names):
         return None
@@ -51,7 +47,7 @@ def _validate_action_with_catalog(
 ) -> DiagnosticIssue | None:
     token_text = token.text
 
-    if catalog.command_node(plugin_name) is None:
+    if not catalog.has_command_node(plugin_name):
         return None
 
     if catalog.is_builtin_leaf(plugin_name):
@@ -84,22 +80,23 @@ def _validate_action_with_catalog(
     )
 
 
-def _validate_options_for_action(
-    tokens: list[TokenSpan], action_node: JsonObject
+def _validate_options_for_signature(
+    tokens: Sequence[TokenSpan], signature: ActionSignature
 ) -> tuple[list[DiagnosticIssue], dict[str, list[str]]]:
     issues: list[DiagnosticIssue] = []
     unknown_option_suggestions: dict[str, list[str]] = {}
 
-    # Get valid options from the action signature
-    valid_options = get_all_option_labels(action_node)
+    folded_options = signature.folded_option_labels
 
     for option in group_option_tokens(tokens, lambda token: token.text):
         option_name = option.option_text
         if option_name in ("--help", "-h"):
             continue
 
-        if not _is_exact_match(option_name, valid_options):
-            suggestions = _get_suggestions(option_name, valid_options, limit=3)
+        if option_name.lower() not in folded_options:
+            suggestions = _get_suggestions(
+                option_name, list(signature.option_labels), limit=3
+            )
             if suggestions:
                 unknown_option_suggestions[option_name] = suggestions
                 message = f"Unknown option '{option_name}'. Did you mean {', '.join(repr(s) for s in suggestions)}?"
@@ -118,23 +115,52 @@ def _validate_options_for_action(
     return issues, unknown_option_suggestions
 
 
-def _validate_options_with_catalog(
-    tokens: list[TokenSpan],
-    catalog: QiimeCatalog,
-    plugin_name: str,
-    action_name: str,
-) -> tuple[list[DiagnosticIssue], dict[str, list[str]]]:
-    """Validate option tokens for a catalog-backed valid command path."""
-    action_node = catalog.action_node(plugin_name, action_name)
-    if action_node is None:
-        return [], {}
+def _has_help_invocation(
+    option_tokens: Sequence[TokenSpan],
+    option_groups: Sequence[OptionGroup[TokenSpan]],
+    signature: ActionSignature,
+) -> bool:
+    """Return whether the option tokens ask for help instead of running.
+
+    ``--help`` (with or without ``=value``) always does. ``-h`` does unless
+    it is the value of the option right before it: grouping attaches it as
+    the first value token of a non-flag option without an inline value.
+    """
+    if any(option.option_text == "--help" for option in option_groups):
+        return True
 
-    return _validate_options_for_action(tokens, action_node)
+    grouped_short_help = 0
+    for option in option_groups:
+        for position, value_token in enumerate(option.value_tokens):
+            if value_token.text != "-h":
+                continue
+            grouped_short_help += 1
+            if (
+                position > 0
+                or option.inline_value is not None
+                or _is_bool_flag_option(option.option_text, signature)
+            ):
+                return True
+
+    # Any "-h" not attached to an option group precedes every option.
+    total_short_help = sum(1 for token in option_tokens if token.text == "-h")
+    return total_short_help > grouped_short_help
+
+
+def _is_bool_flag_option(option_text: str, signature: ActionSignature) -> bool:
+    param_name = normalize_option_to_param_name(option_text)
+    if param_name is None:
+        return False
+    param_name = param_name.lower()
+    return any(
+        name.lower() == param_name and signature_param_is_bool_flag(signature, index)
+        for index, name in enumerate(signature.param_names)
+    )
 
 
-def _validate_required_options_for_action(
-    tokens: list[TokenSpan],
-    action_node: JsonObject,
+def _validate_required_options_for_signature(
+    tokens: Sequence[TokenSpan],
+    signature: ActionSignature,
     unknown_option_suggestions: Mapping[str, Sequence[str]],
 ) -> list[DiagnosticIssue]:
     issues: list[DiagnosticIssue] = []
@@ -145,7 +171,7 @@ def _validate_required_options_for_action(
     option_tokens = tokens[3:]
     option_groups = group_option_tokens(option_tokens, lambda token: token.text)
 
-    if _has_help_invocation(option_tokens, option_groups, action_node):
+    if _has_help_invocation(option_tokens, option_groups, signature):
         return issues
 
     present_param_names: set[str] = set()
@@ -155,14 +181,9 @@ def _validate_required_options_for_action(
             continue
         present_param_names.add(param_name.lower())
 
-    required_param_options = {
-        name.lower(): format_qiime_option_label(option_prefix, name)
-        for name, option_prefix, param in iter_signature_params(action_node)
-        if param_is_required(param)
-    }
     missing_param_options = {
         param_name: option_label
-        for param_name, option_label in required_param_options.items()
+        for param_name, option_label in signature.required_param_options
         if param_name not in present_param_names
     }
 
@@ -191,20 +212,3 @@ def _validate_required_options_for_action(
         )
 
     return issues
-
-
-def _validate_required_options_with_catalog(
-    tokens: list[TokenSpan],
-    catalog: QiimeCatalog,
-    plugin_name: str,
-    action_name: str,
-    unknown_option_suggestions: Mapping[str, Sequence[str]],
-) -> list[DiagnosticIssue]:
-    """Validate required options for a catalog-backed valid command path."""
-    action_node = catalog.action_node(plugin_name, action_name)
-    if action_node is None:
-        return []
-
-    return _validate_required_options_for_action(
-        tokens, action_node, unknown_option_suggestions
-    )
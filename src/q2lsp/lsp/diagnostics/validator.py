@@ -6,24 +6,32 @@ and returns issues with spans and suggestions.
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TypeAlias
+
 from q2lsp.lsp.diagnostics.diagnostic_issue import DiagnosticIssue
 from q2lsp.lsp.diagnostics.matching import _get_unique_prefix_match
 from q2lsp.lsp.diagnostics.stages import (
     _validate_action_with_catalog,
-    _validate_options_with_catalog,
+    _validate_options_for_signature,
     _validate_plugin_or_builtin_with_catalog,
-    _validate_required_options_with_catalog,
+    _validate_required_options_for_signature,
 )
-from q2lsp.lsp.types import ParsedCommand
+from q2lsp.lsp.types import ParsedCommand, TokenSpan
 from q2lsp.qiime.catalog import QiimeCatalog
 
+CommandValidator: TypeAlias = Callable[
+    [ParsedCommand, QiimeCatalog], list[DiagnosticIssue]
+]
+
 
 def validate_command_with_catalog(
     command: ParsedCommand, catalog: QiimeCatalog
 ) -> list[DiagnosticIssue]:
     issues: list[DiagnosticIssue] = []
-    root_node = catalog.root_node()
-    if root_node is None:
+    if not catalog.has_root_node():
         return issues
 
     token1_valid = True
@@ -35,9 +43,8 @@ def validate_command_with_catalog(
             if issue1 is not None:
                 issues.append(issue1)
                 token1_valid = False
-                valid_plugins, valid_builtins = catalog.valid_plugins_and_builtins()
                 token1_for_action = _get_unique_prefix_match(
-                    token1.text, valid_plugins | valid_builtins
+                    token1.text, catalog.valid_root_command_names()
                 )
             else:
                 token1_for_action = token1.text
@@ -53,24 +60,75 @@ def validate_command_with_catalog(
                 token2_valid = False
 
     if token1_valid and token2_valid and len(command.tokens) >= 3:
-        token1 = command.tokens[1]
-        token2 = command.tokens[2]
-        plugin_name = token1.text
-        action_name = token2.text
-        option_issues: list[DiagnosticIssue] = []
-        unknown_option_suggestions: dict[str, list[str]] = {}
-        if len(command.tokens) >= 4:
-            option_issues, unknown_option_suggestions = _validate_options_with_catalog(
-                command.tokens[3:], catalog, plugin_name, action_name
-            )
-        issues.extend(option_issues)
-        required_option_issues = _validate_required_options_with_catalog(
-            command.tokens,
-            catalog,
-            plugin_name,
-            action_name,
-            unknown_option_suggestions,
+        # Both option stages read the same signature; resolve it once.
+        signature = catalog.action_signature(
+            command.tokens[1].text, command.tokens[2].text
         )
-        issues.extend(required_option_issues)
+        if signature is not None:
+            option_issues: list[DiagnosticIssue] = []
+            unknown_option_suggestions: dict[str, list[str]] = {}
+            if len(command.tokens) >= 4:
+                option_issues, unknown_option_suggestions = (
+                    _validate_options_for_signature(command.tokens[3:], signature)
+                )
+            issues.extend(option_issues)
+            issues.extend(
+                _validate_required_options_for_signature(
+                    command.tokens, signature, unknown_option_suggestions
+                )
+            )
 
     return issues
+
+
+def make_cached_command_validator(*, maxsize: int = 256) -> CommandValidator:
+    """Create a validator that memoizes results per command shape.
+
+    Results are keyed by the command's token texts and spans relative to the
+    command start, so an unchanged command keeps its cached issues even when
+    edits elsewhere shift it within the document. The cache is cleared
+    whenever a different catalog instance is passed in.
+
+    Thread-safe: the cache may be shared by concurrent callers.
+    """
+    cache: OrderedDict[tuple[TokenSpan, ...], tuple[DiagnosticIssue, ...]] = (
+        OrderedDict()
+    )
+    cached_catalog: QiimeCatalog | None = None
+    lock = threading.Lock()
+
+    def validate(
+        command: ParsedCommand, catalog: QiimeCatalog
+    ) -> list[DiagnosticIssue]:
+        nonlocal cached_catalog
+        base = command.start
+        key = tuple(
+            TokenSpan(text=token.text, start=token.start - base, end=token.end - base)
+            for token in command.tokens
+        )
+
+        with lock:
+            if catalog is not cached_catalog:
+                cache.clear()
+                cached_catalog = catalog
+            relative_issues = cache.get(key)
+            if relative_issues is not None:
+                cache.move_to_end(key)
+
+        if relative_issues is None:
+            relative_issues = tuple(
+                issue._replace(start=issue.start - base, end=issue.end - base)
+                for issue in validate_command_with_catalog(command, catalog)
+            )
+            with lock:
+                if catalog is cached_catalog:
+                    cache[key] = relative_issues
+                    if len(cache) > maxsize:
+                        cache.popitem(last=False)
+
+        return [
+            issue._replace(start=issue.start + base, end=issue.end + base)
+            for issue in relative_issues
+        ]
+
+    return validate
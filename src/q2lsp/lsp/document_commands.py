@@ -6,8 +6,11 @@ with transparent bidirectional offset mapping between original and merged text.
 
 from __future__ import annotations
 
+import threading
 from bisect import bisect_left
-from typing import NamedTuple
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import NamedTuple, TypeAlias
 
 from q2lsp.lsp.completion_context import get_context_from_merged
 from q2lsp.lsp.parser import find_qiime_commands, merge_line_continuations
@@ -19,12 +22,13 @@ class AnalyzedDocument(NamedTuple):
 
     Attributes:
         merged_text: Source text with line continuations merged.
-        offset_map: Maps each merged-text position to its original-text position.
+        offset_map: Maps each merged-text position to its original-text position
+            (read-only view over a compact integer array).
         commands: All QIIME commands found in the merged text.
     """
 
     merged_text: str
-    offset_map: tuple[int, ...]
+    offset_map: Sequence[int]
     commands: tuple[ParsedCommand, ...]
 
 
@@ -38,11 +42,44 @@ def analyze_document(source: str) -> AnalyzedDocument:
     commands = find_qiime_commands(merged_text)
     return AnalyzedDocument(
         merged_text=merged_text,
-        offset_map=tuple(offset_map),
+        offset_map=memoryview(offset_map).toreadonly(),
         commands=tuple(commands),
     )
 
 
+DocumentAnalyzer: TypeAlias = Callable[[str, str], AnalyzedDocument]
+
+
+def make_cached_document_analyzer(*, maxsize: int = 64) -> DocumentAnalyzer:
+    """Create an analyze_document wrapper that remembers recent documents.
+
+    The returned callable takes ``(uri, source)``. Completion, hover and
+    diagnostics for an unchanged document share a single analysis; a
+    document is re-analyzed only when its source text differs from the
+    cached one. At most ``maxsize`` documents are kept (least recently used
+    first out).
+    """
+    cache: OrderedDict[str, tuple[str, AnalyzedDocument]] = OrderedDict()
+    lock = threading.Lock()
+
+    def analyze(uri: str, source: str) -> AnalyzedDocument:
+        with lock:
+            cached = cache.get(uri)
+            if cached is not None and cached[0] == source:
+                cache.move_to_end(uri)
+                return cached[1]
+
+        doc = analyze_document(source)
+        with lock:
+            cache[uri] = (source, doc)
+            cache.move_to_end(uri)
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+        return doc
+
+    return analyze
+
+
 def to_original_offset(doc: AnalyzedDocument, merged_offset: int) -> int:
     """Map a merged-text offset back to the original source offset.
 
@@ -5,7 +5,7 @@ Provides hover help text based on cursor position and catalog metadata.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
 from q2lsp.lsp.types import CompletionContext, TokenSpan
 from q2lsp.qiime.catalog import QiimeCatalog
@@ -56,7 +56,7 @@ def get_hover_help(
 
 
 def _get_help_via_provider(
-    tokens: list[TokenSpan],
+    tokens: Sequence[TokenSpan],
     token_index: int,
     get_help: Callable[[list[str]], str | None],
 ) -> str | None:
@@ -92,7 +92,7 @@ def _get_help_via_provider(
 
 
 def _get_help_via_catalog(
-    tokens: list[TokenSpan],
+    tokens: Sequence[TokenSpan],
     current_token: TokenSpan,
     token_index: int,
     catalog: QiimeCatalog,
@@ -6,10 +6,25 @@ and QIIME command detection for completion context.
 
 from __future__ import annotations
 
+import re
+from array import array
+
 from q2lsp.lsp.types import CompletionContext, ParsedCommand, TokenSpan
 
+# Characters that can split a line into several commands or change quoting.
+# Text without any of them is a single command segment.
+_SHELL_METACHARACTERS = frozenset(";|&'\"\\\n")
+_QUOTING_CHARACTERS = frozenset("'\"\\")
+
+# Body of a double-quoted string: escaped pairs or anything but a quote or
+# backslash, plus a dangling backslash at the end of the line.
+_DOUBLE_QUOTED_BODY_RE = re.compile(r'(?:[^"\\]|\\.)*\\?', re.DOTALL)
+_BACKSLASH_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+# Run of unquoted characters that need no special handling.
+_PLAIN_RUN_RE = re.compile(r"[^ \t'\"\\]+")
+
 
-def merge_line_continuations(text: str) -> tuple[str, list[int]]:
+def merge_line_continuations(text: str) -> tuple[str, array[int]]:
     """
     Merge lines with backslash continuations into a single line.
 
@@ -19,28 +34,28 @@ def merge_line_continuations(text: str) -> tuple[str, list[int]]:
     Returns:
         A tuple of (merged_text, offset_map) where:
         - merged_text: Text with continuations merged (backslash+newline removed)
-        - offset_map: Maps merged position -> original position.
-                      Length is len(merged_text) + 1 for boundary mapping.
+        - offset_map: Maps merged position -> original position, stored as a
+                      compact C-int array. Length is len(merged_text) + 1 for
+                      boundary mapping.
     """
     merged: list[str] = []
-    offset_map: list[int] = []
+    offset_map: array[int] = array("i")
     i = 0
     n = len(text)
 
+    # Copy the runs between backslash-newline pairs as whole slices instead of
+    # walking the text one character at a time.
     while i < n:
-        # Check for backslash followed by newline (line continuation)
-        if text[i] == "\\" and i + 1 < n and text[i + 1] == "\n":
-            # Skip the backslash and newline - don't add to merged
-            i += 2
-            continue
-
-        # Regular character - add to merged and record mapping
-        offset_map.append(i)
-        merged.append(text[i])
-        i += 1
+        j = text.find("\\\n", i)
+        if j < 0:
+            j = n
+        merged.append(text[i:j])
+        offset_map.extend(range(i, j))
+        # Skip the backslash and newline - don't add to merged
+        i = j + 2
 
     # Add final boundary mapping (position after last char)
-    offset_map.append(i)
+    offset_map.append(n)
 
     return "".join(merged), offset_map
 
@@ -85,22 +100,20 @@ def tokenize_shell_line(line: str, line_start_offset: int) -> list[TokenSpan]:
             elif char == "'":
                 # Single quoted string - no escapes
                 i += 1  # Skip opening quote
-                while i < n and line[i] != "'":
-                    token_chars.append(line[i])
-                    i += 1
+                close = line.find("'", i)
+                if close < 0:
+                    close = n
+                token_chars.append(line[i:close])
+                i = close
                 if i < n:
                     i += 1  # Skip closing quote
             elif char == '"':
                 # Double quoted string - backslash escapes
                 i += 1  # Skip opening quote
-                while i < n and line[i] != '"':
-                    if line[i] == "\\" and i + 1 < n:
-                        i += 1  # Skip backslash
-                        token_chars.append(line[i])
-                        i += 1
-                    else:
-                        token_chars.append(line[i])
-                        i += 1
+                body = _DOUBLE_QUOTED_BODY_RE.match(line, i)
+                if body is not None:  # Always matches; may be empty
+                    token_chars.append(_BACKSLASH_ESCAPE_RE.sub(r"\1", body.group()))
+                    i = body.end()
                 if i < n:
                     i += 1  # Skip closing quote
             elif char == "\\" and i + 1 < n:
@@ -109,9 +122,14 @@ def tokenize_shell_line(line: str, line_start_offset: int) -> list[TokenSpan]:
                 token_chars.append(line[i])
                 i += 1
             else:
-                # Regular character
-                token_chars.append(char)
-                i += 1
+                # Run of regular characters (or a lone trailing backslash)
+                run = _PLAIN_RUN_RE.match(line, i)
+                if run is None:
+                    token_chars.append(char)
+                    i += 1
+                else:
+                    token_chars.append(run.group())
+                    i = run.end()
 
         if token_chars or i > token_start:
             tokens.append(
@@ -140,10 +158,16 @@ def find_qiime_commands(text: str) -> list[ParsedCommand]:
     """
     commands: list[ParsedCommand] = []
 
-    # Split into command segments at separators
-    segments = _split_commands(text)
+    # Split into command segments at separators; plain single-command text
+    # (the common case while typing) skips the separator scan entirely.
+    if _SHELL_METACHARACTERS.isdisjoint(text):
+        segments = [(0, len(text))] if text else []
+    else:
+        segments = _split_commands(text)
 
     for seg_start, seg_end in segments:
+        if not _may_start_with_qiime(text, seg_start, seg_end):
+            continue
         segment = text[seg_start:seg_end]
         tokens = tokenize_shell_line(segment, seg_start)
 
@@ -151,7 +175,7 @@ def find_qiime_commands(text: str) -> list[ParsedCommand]:
         if tokens and tokens[0].text == "qiime":
             commands.append(
                 ParsedCommand(
-                    tokens=tokens,
+                    tokens=tuple(tokens),
                     start=tokens[0].start,
                     end=seg_end,
                 )
@@ -160,6 +184,26 @@ def find_qiime_commands(text: str) -> list[ParsedCommand]:
     return commands
 
 
+def _may_start_with_qiime(text: str, start: int, end: int) -> bool:
+    """
+    Cheap pre-check that a segment's first token could be "qiime".
+
+    Returns False only when the raw first word rules it out, so segments
+    such as `cd`, `echo` or `set` are never tokenized. A first word with
+    quotes or backslashes may still unescape to "qiime" and is left to the
+    tokenizer.
+    """
+    i = start
+    while i < end and text[i] in " \t":
+        i += 1
+    word_start = i
+    while i < end and text[i] not in " \t":
+        if text[i] in _QUOTING_CHARACTERS:
+            return True
+        i += 1
+    return i - word_start == 5 and text.startswith("qiime", word_start)
+
+
 def _split_commands(text: str) -> list[tuple[int, int]]:
     """
     Split text into command segments at ;, &&, ||, |, and newline.
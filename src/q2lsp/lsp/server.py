@@ -5,7 +5,9 @@ Provides completion support for QIIME2 CLI commands in shell scripts.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 from collections.abc import Callable, Generator
 from typing import Any
 
@@ -17,30 +19,39 @@ from pygls.protocol.language_server import lsp_method
 from pygls.uris import from_fs_path
 from pygls.workspace import Workspace
 
+from q2lsp.core.types import CompletionMode
 from q2lsp.logging import get_logger
 from q2lsp.lsp.adapter import (
     LSP_POSITION_ENCODING,
+    make_cached_completion_items_converter,
+    make_cached_offset_mapper,
     offset_to_position as _offset_to_position,
     position_to_offset as _position_to_offset,
-    to_lsp_completion_item as _to_lsp_completion_item,
 )
-from q2lsp.lsp.diagnostics import validate_command_with_catalog
 from q2lsp.lsp.diagnostics.codes import DEFAULT_SEVERITY, DIAGNOSTIC_SEVERITY
 from q2lsp.lsp.diagnostics.debounce import DebounceManager
+from q2lsp.lsp.diagnostics.validator import make_cached_command_validator
 from q2lsp.lsp.document_commands import (
-    analyze_document,
+    make_cached_document_analyzer,
     resolve_completion_context,
     to_original_offset,
 )
 from q2lsp.lsp.error_handling import wrap_async_handler, wrap_handler
 from q2lsp.lsp.hover import get_hover_help
-from q2lsp.qiime.catalog import make_catalog_provider
+from q2lsp.qiime.catalog import QiimeCatalog, make_catalog_provider
 from q2lsp.qiime.hierarchy_provider import HierarchyProvider
 from q2lsp.usecases.get_completions_usecase import (
     CompletionRequest,
-    get_completions,
+    make_cached_completions,
 )
 
+MAX_COMPLETION_ITEMS = 200
+"""Upper bound on items returned per completion response.
+
+Larger result sets are truncated and marked incomplete so the client
+re-requests as the user keeps typing.
+"""
+
 
 class Utf16LanguageServerProtocol(LanguageServerProtocol):
     """Language server protocol that keeps q2lsp wire positions UTF-16."""
@@ -96,6 +107,7 @@ def create_server(
     get_help: Callable[[list[str]], str | None] | None = None,
     logger: logging.Logger | None = None,
     debounce_ms: int = 400,
+    warm_catalog: bool = False,
 ) -> LanguageServer:
     """
     Create and configure the LSP server.
@@ -105,6 +117,8 @@ def create_server(
         get_help: Provider function for hover help text (takes command path).
         logger: Optional logger instance. If None, uses default q2lsp.lsp logger.
         debounce_ms: Debounce delay in milliseconds for diagnostics. Default 400.
+        warm_catalog: Build the QIIME catalog in a background thread right away,
+            overlapping the expensive hierarchy build with the client handshake.
 
     Returns:
         Configured LanguageServer instance with completion support.
@@ -115,6 +129,32 @@ def create_server(
     server = LanguageServer("q2lsp", "v0.1.0", protocol_cls=Utf16LanguageServerProtocol)
     debounce_manager = DebounceManager()
     get_catalog = make_catalog_provider(get_hierarchy)
+    validate_command = make_cached_command_validator()
+    analyze_document = make_cached_document_analyzer()
+    to_lsp_completion_items = make_cached_completion_items_converter()
+    get_completions = make_cached_completions()
+    get_offset_mapper = make_cached_offset_mapper()
+
+    # Root and plugin completions with an empty prefix depend only on the
+    # catalog and the plugin name, so those responses are built once per
+    # catalog and reused on every "qiime " / "qiime <plugin> " request.
+    empty_prefix_responses: dict[
+        tuple[str, str], tuple[tuple[types.CompletionItem, ...], bool]
+    ] = {}
+    empty_prefix_catalog: QiimeCatalog | None = None
+
+    def _warm_catalog() -> None:
+        try:
+            get_catalog()
+        except Exception:
+            logger.warning("Background catalog warm-up failed", exc_info=True)
+        else:
+            logger.debug("Background catalog warm-up finished")
+
+    if warm_catalog:
+        threading.Thread(
+            target=_warm_catalog, name="q2lsp-catalog-warm", daemon=True
+        ).start()
 
     def _empty_completion_list() -> types.CompletionList:
         return types.CompletionList(is_incomplete=False, items=[])
@@ -137,15 +177,18 @@ def create_server(
 
         Provides completion for QIIME2 CLI commands in shell scripts.
         """
+        nonlocal empty_prefix_catalog
         logger.debug("Completion request at %s", params.position)
 
         document = server.workspace.get_text_document(params.text_document.uri)
 
         # Calculate document offset from line/character position
-        offset = _position_to_offset(document, params.position)
+        offset = _position_to_offset(
+            document, params.position, mapper=get_offset_mapper(document)
+        )
 
         # Analyze document and get completion context
-        doc = analyze_document(document.source)
+        doc = analyze_document(document.uri, document.source)
         ctx = resolve_completion_context(doc, offset)
         logger.debug("Completion context: mode=%s, prefix=%s", ctx.mode, ctx.prefix)
 
@@ -158,17 +201,35 @@ def create_server(
             prefix=ctx.prefix,
             command_tokens=command_tokens,
         )
-        internal_items = get_completions(request, get_catalog())
+        catalog = get_catalog()
+
+        response_key = _empty_prefix_response_key(request, catalog)
+        if response_key is not None:
+            if catalog is not empty_prefix_catalog:
+                empty_prefix_responses.clear()
+                empty_prefix_catalog = catalog
+            cached = empty_prefix_responses.get(response_key)
+            if cached is not None:
+                cached_items, is_incomplete = cached
+                logger.debug("Returning %d cached completion items", len(cached_items))
+                return types.CompletionList(
+                    is_incomplete=is_incomplete,
+                    items=list(cached_items),
+                )
+
+        internal_items = get_completions(request, catalog)
+        is_incomplete = len(internal_items) > MAX_COMPLETION_ITEMS
 
-        # Convert to LSP CompletionItems
-        lsp_items = [
-            _to_lsp_completion_item(item, position=params.position, prefix=ctx.prefix)
-            for item in internal_items
-        ]
+        # Convert to LSP CompletionItems, skipping items beyond the cap
+        lsp_items = to_lsp_completion_items(
+            internal_items[:MAX_COMPLETION_ITEMS], params.position, ctx.prefix
+        )
+        if response_key is not None:
+            empty_prefix_responses[response_key] = (tuple(lsp_items), is_incomplete)
 
         logger.debug("Returning %d completion items", len(lsp_items))
         return types.CompletionList(
-            is_incomplete=False,
+            is_incomplete=is_incomplete,
             items=lsp_items,
         )
 
@@ -192,10 +253,12 @@ def create_server(
         document = server.workspace.get_text_document(params.text_document.uri)
 
         # Calculate document offset from line/character position
-        offset = _position_to_offset(document, params.position)
+        offset = _position_to_offset(
+            document, params.position, mapper=get_offset_mapper(document)
+        )
 
         # Analyze document and get hover help
-        doc = analyze_document(document.source)
+        doc = analyze_document(document.uri, document.source)
         ctx = resolve_completion_context(doc, offset)
         catalog = get_catalog() if get_help is None else None
         help_text = get_hover_help(ctx, get_help=get_help, catalog=catalog)
@@ -237,32 +300,42 @@ def create_server(
 
         try:
             # Analyze document
-            doc = analyze_document(document.source)
+            doc = analyze_document(document.uri, document.source)
 
             catalog = get_catalog()
 
-            # Validate each command
+            # Validate commands in a worker thread so a long script does not
+            # block other LSP traffic on the event loop. A newer edit cancels
+            # this task through the debounce manager while it waits.
+            issues_per_command = await asyncio.to_thread(
+                lambda: [validate_command(cmd, catalog) for cmd in doc.commands]
+            )
+
+            mapper = get_offset_mapper(document)
             lsp_diagnostics: list[types.Diagnostic] = []
-            for cmd in doc.commands:
-                issues = validate_command_with_catalog(cmd, catalog)
+            for issues in issues_per_command:
                 for issue in issues:
                     # Map merged offsets back to original offsets
                     original_start = to_original_offset(doc, issue.start)
                     original_end = to_original_offset(doc, issue.end)
 
-                # Convert offsets to LSP position
-                start_pos = _offset_to_position(document, original_start)
-                end_pos = _offset_to_position(document, original_end)
-
-                lsp_diagnostics.append(
-                    types.Diagnostic(
-                        range=types.Range(start=start_pos, end=end_pos),
-                        message=issue.message,
-                        severity=DIAGNOSTIC_SEVERITY.get(issue.code, DEFAULT_SEVERITY),
-                        source="q2lsp",
-                        code=issue.code,
+                    # Convert offsets to LSP position
+                    start_pos = _offset_to_position(
+                        document, original_start, mapper=mapper
+                    )
+                    end_pos = _offset_to_position(document, original_end, mapper=mapper)
+
+                    lsp_diagnostics.append(
+                        types.Diagnostic(
+                            range=types.Range(start=start_pos, end=end_pos),
+                            message=issue.message,
+                            severity=DIAGNOSTIC_SEVERITY.get(
+                                issue.code, DEFAULT_SEVERITY
+                            ),
+                            source="q2lsp",
+                            code=issue.code,
+                        )
                     )
-                )
 
             # Publish diagnostics using pygls standard method
             server.text_document_publish_diagnostics(
@@ -351,3 +424,18 @@ def create_server(
         await debounce_manager.cancel(uri)
 
     return server
+
+
+def _empty_prefix_response_key(
+    request: CompletionRequest, catalog: QiimeCatalog
+) -> tuple[str, str] | None:
+    """Key for a reusable empty-prefix root/plugin response, if there is one."""
+    if request.prefix or not request.command_tokens:
+        return None
+    if request.mode == CompletionMode.ROOT:
+        return (CompletionMode.ROOT, "")
+    if request.mode == CompletionMode.PLUGIN and len(request.command_tokens) > 1:
+        plugin_name = request.command_tokens[1]
+        if catalog.has_command_node(plugin_name):
+            return (CompletionMode.PLUGIN, plugin_name)
+    return None
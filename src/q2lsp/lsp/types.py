@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import NamedTuple
 
-from q2lsp.core.types import CompletionMode
+from q2lsp.core.types import CompletionModeName
 from q2lsp.qiime.options import OptionGroup, group_option_tokens
 
 
@@ -19,7 +20,7 @@ class TokenSpan(NamedTuple):
 class ParsedCommand(NamedTuple):
     """A parsed QIIME command with its tokens and position."""
 
-    tokens: list[TokenSpan]
+    tokens: Sequence[TokenSpan]  # Immutable tuple when produced by the parser
     start: int  # Start offset in original text
     end: int  # End offset in original text (exclusive)
 
@@ -31,7 +32,7 @@ class ParsedCommand(NamedTuple):
 class CompletionContext(NamedTuple):
     """Context for completion at a specific position."""
 
-    mode: CompletionMode
+    mode: CompletionModeName
     command: ParsedCommand | None  # The QIIME command containing the cursor
     current_token: TokenSpan | None  # Token at cursor (may be partial)
     token_index: int  # Index of current token in command (0-based)
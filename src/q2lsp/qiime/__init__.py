@@ -1,6 +1,24 @@
-from q2lsp.qiime.q2cli_gateway import (
-    build_qiime_catalog,
-    build_qiime_hierarchy,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from q2lsp.qiime.q2cli_gateway import build_qiime_catalog, build_qiime_hierarchy
 
 __all__ = ["build_qiime_catalog", "build_qiime_hierarchy"]
+
+
+def __getattr__(name: str) -> object:
+    """Lazily re-export the q2cli gateway builders.
+
+    Importing any q2lsp.qiime submodule runs this package first; deferring the
+    gateway keeps click and q2cli out of imports that only need options,
+    types or the catalog.
+    """
+    if name in __all__:
+        from q2lsp.qiime import q2cli_gateway
+
+        value = getattr(q2cli_gateway, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
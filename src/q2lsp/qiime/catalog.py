@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import sys
+import threading
 from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from types import MappingProxyType
 from typing import TypeAlias, cast
 
@@ -10,6 +12,7 @@ from q2lsp.qiime.hierarchy_keys import (
     COMMAND_METADATA_KEYS,
     ROOT_METADATA_KEYS,
 )
+from q2lsp.qiime.signature_params import ActionSignature, build_action_signature
 from q2lsp.qiime.types import CommandHierarchy, JsonObject, JsonPrimitive, JsonValue
 
 CatalogProvider: TypeAlias = Callable[[], "QiimeCatalog"]
@@ -30,6 +33,15 @@ class QiimeCatalog:
     """
 
     hierarchy: Mapping[str, FrozenJsonObject]
+    _action_signatures: dict[tuple[str, str], ActionSignature] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _child_names: dict[str, tuple[str, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _root_command_names: dict[str, tuple[str, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_hierarchy(cls, hierarchy: CommandHierarchy) -> "QiimeCatalog":
@@ -82,27 +94,40 @@ class QiimeCatalog:
         }
         return valid_plugins, valid_builtins
 
-    def valid_actions(self, command_name: str) -> list[str]:
-        command_node = self._command_node(command_name)
-        if command_node is None:
-            return []
+    def valid_root_command_names(self) -> list[str]:
+        """Return plugin and builtin names sorted, computed once per catalog.
 
-        return [
-            key
-            for key, value in command_node.items()
-            if key not in COMMAND_METADATA_KEYS and isinstance(value, Mapping)
-        ]
+        Sorting keeps suggestion order independent of set iteration order.
+        """
+        root_name = self.root_name
+        cached = self._root_command_names.get(root_name)
+        if cached is None:
+            valid_plugins, valid_builtins = self.valid_plugins_and_builtins()
+            cached = tuple(sorted(valid_plugins | valid_builtins))
+            self._root_command_names[root_name] = cached
+        return list(cached)
+
+    def valid_actions(self, command_name: str) -> list[str]:
+        return list(self._command_child_names(command_name))
 
     def is_builtin_leaf(self, command_name: str) -> bool:
         command_node = self._command_node(command_name)
         if command_node is None or command_node.get("type") != "builtin":
             return False
 
-        return not any(
-            key not in BUILTIN_NODE_METADATA_KEYS and isinstance(value, Mapping)
-            for key, value in command_node.items()
+        return all(
+            name in BUILTIN_NODE_METADATA_KEYS
+            for name in self._command_child_names(command_name)
         )
 
+    def has_root_node(self) -> bool:
+        """Return whether the root node exists, without copying it."""
+        return self._root_node() is not None
+
+    def has_command_node(self, command_name: str) -> bool:
+        """Return whether the command node exists, without copying it."""
+        return self._command_node(command_name) is not None
+
     def command_node(self, command_name: str) -> dict[str, JsonValue] | None:
         value = self._command_node(command_name)
         if value is None:
@@ -116,13 +141,29 @@ class QiimeCatalog:
         return cast(JsonObject, _thaw_json(root_node))
 
     def action_node(self, command_name: str, action_name: str) -> JsonObject | None:
-        command_node = self.command_node(command_name)
+        command_node = self._command_node(command_name)
         if command_node is None:
             return None
         value = command_node.get(action_name)
-        if not isinstance(value, dict):
+        if not isinstance(value, Mapping):
             return None
-        return value
+        return cast(JsonObject, _thaw_json(value))
+
+    def action_signature(
+        self, command_name: str, action_name: str
+    ) -> ActionSignature | None:
+        """Return the action's signature columns, built once per action."""
+        key = (command_name, action_name)
+        cached = self._action_signatures.get(key)
+        if cached is not None:
+            return cached
+
+        action_node = self.action_node(command_name, action_name)
+        if action_node is None:
+            return None
+        signature = build_action_signature(action_node)
+        self._action_signatures[key] = signature
+        return signature
 
     def root_help(self) -> str | None:
         root_node = self._root_node()
@@ -185,22 +226,47 @@ class QiimeCatalog:
             return None
         return value
 
+    def _command_child_names(self, command_name: str) -> tuple[str, ...]:
+        """Return the command's action keys, filtered from metadata once."""
+        cached = self._child_names.get(command_name)
+        if cached is not None:
+            return cached
+
+        command_node = self._command_node(command_name)
+        if command_node is None:
+            return ()
+        names = tuple(
+            key
+            for key, value in command_node.items()
+            if key not in COMMAND_METADATA_KEYS and isinstance(value, Mapping)
+        )
+        self._child_names[command_name] = names
+        return names
+
 
 def make_catalog_provider(get_hierarchy: Callable[[], CommandHierarchy]) -> CatalogProvider:
+    """Create a provider that builds the catalog once, even across threads."""
     catalog: QiimeCatalog | None = None
+    lock = threading.Lock()
 
     def provider() -> QiimeCatalog:
         nonlocal catalog
         if catalog is None:
-            catalog = QiimeCatalog.from_hierarchy(get_hierarchy())
+            with lock:
+                if catalog is None:
+                    catalog = QiimeCatalog.from_hierarchy(get_hierarchy())
         return catalog
 
     return provider
 
 
 def _freeze_json(value: JsonValue) -> FrozenJsonValue:
+    # Keys (plugin, action and property names) repeat across the whole
+    # hierarchy, so interning them lets every node share one copy.
     if isinstance(value, dict):
-        return MappingProxyType({key: _freeze_json(item) for key, item in value.items()})
+        return MappingProxyType(
+            {sys.intern(key): _freeze_json(item) for key, item in value.items()}
+        )
     if isinstance(value, list):
         return tuple(_freeze_json(item) for item in value)
     return value
@@ -209,8 +275,8 @@ def _freeze_json(value: JsonValue) -> FrozenJsonValue:
 def _freeze_hierarchy(hierarchy: CommandHierarchy) -> Mapping[str, FrozenJsonObject]:
     return MappingProxyType(
         {
-            command_name: MappingProxyType(
-                {key: _freeze_json(item) for key, item in command.items()}
+            sys.intern(command_name): MappingProxyType(
+                {sys.intern(key): _freeze_json(item) for key, item in command.items()}
             )
             for command_name, command in hierarchy.items()
         }
@@ -0,0 +1,174 @@
+"""Persistent on-disk cache for the QIIME command hierarchy.
+
+Building the hierarchy instantiates q2cli's RootCommand and walks every
+plugin action, which takes seconds. The result only changes when QIIME
+packages or plugins are installed, upgraded or removed, so it is stored as
+JSON under the user cache directory and keyed by those distributions, the
+cache schema version and the q2lsp version.
+
+Set ``Q2LSP_NO_HIERARCHY_CACHE`` to a non-empty value to always rebuild the
+hierarchy from q2cli without reading or writing the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Iterator
+from importlib import metadata
+from pathlib import Path
+
+from q2lsp.logging import get_logger
+from q2lsp.qiime.types import CommandHierarchy
+
+try:  # Optional C serializer; the stdlib json module is the fallback.
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
+__all__ = [
+    "hierarchy_cache_enabled",
+    "hierarchy_cache_path",
+    "load_cached_hierarchy",
+    "store_cached_hierarchy",
+]
+
+_DISABLE_CACHE_ENV_VAR = "Q2LSP_NO_HIERARCHY_CACHE"
+# Bump when the stored hierarchy layout changes, so older files are not read.
+_HIERARCHY_CACHE_SCHEMA_VERSION = 1
+_QIIME_DISTRIBUTION_PREFIXES = ("q2", "qiime")
+_METADATA_DIRECTORY_SUFFIXES = (".dist-info", ".egg-info")
+# q2cli discovers plugins through this entry point group, and plugin
+# distributions need not be named after QIIME (e.g. gemelli, empress).
+_PLUGIN_ENTRY_POINT_SECTION = "[qiime2.plugins]"
+
+_logger = get_logger("qiime.hierarchy_cache")
+
+
+def hierarchy_cache_enabled() -> bool:
+    """Return False when the user has opted out of the on-disk cache."""
+    return not os.environ.get(_DISABLE_CACHE_ENV_VAR)
+
+
+def hierarchy_cache_path() -> Path:
+    """Return the cache file for the currently installed QIIME distributions."""
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    cache_root = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return cache_root / "q2lsp" / f"hierarchy-{_installed_distributions_key()}.json"
+
+
+def load_cached_hierarchy(path: Path) -> CommandHierarchy | None:
+    """Load a stored hierarchy, or None when it is missing or unreadable."""
+    try:
+        hierarchy = _loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        _logger.warning("Ignoring unreadable hierarchy cache %s: %s", path, exc)
+        return None
+
+    if not isinstance(hierarchy, dict) or not all(
+        isinstance(name, str) and isinstance(node, dict)
+        for name, node in hierarchy.items()
+    ):
+        _logger.warning("Ignoring malformed hierarchy cache %s", path)
+        return None
+    return hierarchy
+
+
+def store_cached_hierarchy(path: Path, hierarchy: CommandHierarchy) -> None:
+    """Atomically write the hierarchy to path; failures are logged, not raised."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(_dumps(hierarchy))
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except (OSError, TypeError, ValueError) as exc:
+        _logger.warning("Could not write hierarchy cache %s: %s", path, exc)
+
+
+def _dumps(hierarchy: CommandHierarchy) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(hierarchy)
+    return json.dumps(hierarchy, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> object:
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def _installed_distributions_key() -> str:
+    # The metadata directory mtime changes when a distribution is reinstalled
+    # at the same version, e.g. an editable plugin under development.
+    parts = [
+        f"schema={_HIERARCHY_CACHE_SCHEMA_VERSION}",
+        f"q2lsp={_q2lsp_version()}",
+        *sorted(
+            _distribution_fingerprint(path) for path in _qiime_metadata_directories()
+        ),
+    ]
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _q2lsp_version() -> str:
+    try:
+        return metadata.version("q2lsp")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _distribution_fingerprint(metadata_dir: str) -> str:
+    dist = metadata.Distribution.at(metadata_dir)
+    try:
+        mtime_ns = os.stat(metadata_dir).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return f"{dist.metadata['Name']}=={dist.version}@{mtime_ns}"
+
+
+def _qiime_metadata_directories() -> Iterator[str]:
+    """Yield metadata directories of QIIME distributions and plugin registrants.
+
+    metadata.distributions() parses the metadata of every installed package,
+    which dominates a warm start in a full QIIME environment. Metadata
+    directories are named after their normalized distribution name, so QIIME
+    packages are matched on directory names; any other package is included
+    only if its entry_points.txt declares a qiime2.plugins entry point.
+    """
+    for path_entry in sys.path:
+        try:
+            with os.scandir(path_entry or ".") as entries:
+                metadata_dirs = sorted(
+                    (entry.name, entry.path)
+                    for entry in entries
+                    if entry.name.endswith(_METADATA_DIRECTORY_SUFFIXES)
+                )
+        except OSError:
+            continue
+        for name, path in metadata_dirs:
+            if name.lower().startswith(
+                _QIIME_DISTRIBUTION_PREFIXES
+            ) or _registers_qiime_plugin(path):
+                yield path
+
+
+def _registers_qiime_plugin(metadata_dir: str) -> bool:
+    try:
+        with open(
+            os.path.join(metadata_dir, "entry_points.txt"), encoding="utf-8"
+        ) as entry_points:
+            return _PLUGIN_ENTRY_POINT_SECTION in entry_points.read()
+    except (OSError, UnicodeDecodeError):
+        return False
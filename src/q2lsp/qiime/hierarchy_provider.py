@@ -5,6 +5,12 @@ from collections.abc import Callable
 from typing import TypeAlias
 
 from q2lsp.logging import get_logger
+from q2lsp.qiime.hierarchy_cache import (
+    hierarchy_cache_enabled,
+    hierarchy_cache_path,
+    load_cached_hierarchy,
+    store_cached_hierarchy,
+)
 from q2lsp.qiime.types import CommandHierarchy
 
 HierarchyBuilder: TypeAlias = Callable[[], CommandHierarchy]
@@ -20,10 +26,24 @@ __all__ = [
 
 
 def build_qiime_hierarchy() -> CommandHierarchy:
-    """Build QIIME2 command hierarchy from q2cli (expensive operation)."""
+    """Build QIIME2 command hierarchy from q2cli (expensive operation).
+
+    The result is persisted under the user cache directory, keyed by the
+    installed QIIME distributions and plugins, so later server starts skip
+    q2cli. Setting Q2LSP_NO_HIERARCHY_CACHE bypasses the stored copy.
+    """
+    cache_path = hierarchy_cache_path() if hierarchy_cache_enabled() else None
+    if cache_path is not None:
+        cached = load_cached_hierarchy(cache_path)
+        if cached is not None:
+            return cached
+
     from q2lsp.qiime.q2cli_gateway import build_qiime_hierarchy as build_hierarchy
 
-    return build_hierarchy()
+    hierarchy = build_hierarchy()
+    if cache_path is not None:
+        store_cached_hierarchy(cache_path, hierarchy)
+    return hierarchy
 
 
 def make_cached_hierarchy_provider(builder: HierarchyBuilder) -> HierarchyProvider:
@@ -40,17 +60,17 @@ def make_cached_hierarchy_provider(builder: HierarchyBuilder) -> HierarchyProvid
     def provider() -> CommandHierarchy:
         nonlocal cache
         # Double-checked locking: check cache without lock first
-        if cache is None:
+        hierarchy = cache
+        if hierarchy is None:
             with _lock:
                 # Check again while holding lock
-                if cache is None:
+                hierarchy = cache
+                if hierarchy is None:
                     _logger.debug("Hierarchy cache miss - building hierarchy")
-                    cache = builder()
-                else:
-                    _logger.debug("Hierarchy cache hit - using cached hierarchy")
-        else:
-            _logger.debug("Hierarchy cache hit - using cached hierarchy")
-        return cache
+                    hierarchy = cache = builder()
+                    return hierarchy
+        _logger.debug("Hierarchy cache hit - using cached hierarchy")
+        return hierarchy
 
     return provider
 
@@ -6,14 +6,20 @@ from typing import Generic, TypeVar
 
 from q2lsp.qiime.types import ActionSignatureParameter
 
-_QIIME_PREFIXES = ("input", "output", "parameter", "metadata")
-_PREFIX_MAP = {"input": "i", "output": "o", "parameter": "p", "metadata": "m"}
+# Signature kinds that map to an option prefix, keyed by their (distinct)
+# first letter so a kind is matched with one lookup and one startswith.
+_PREFIXED_KIND_BY_INITIAL = {
+    "i": ("input", "i"),
+    "o": ("output", "o"),
+    "p": ("parameter", "p"),
+    "m": ("metadata", "m"),
+}
 Q2_SIGNATURE_KINDS = frozenset({"input", "output", "parameter", "metadata", "artifact"})
 _QIIME_OPTION_PREFIXES = frozenset({"i", "o", "p", "m"})
 _T = TypeVar("_T", covariant=True)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OptionGroup(Generic[_T]):
     token: _T
     option_text: str
@@ -112,16 +118,18 @@ def param_is_required(param: ActionSignatureParameter) -> bool:
 
 def qiime_option_prefix(param: ActionSignatureParameter) -> str:
     kind = qiime_signature_kind(param)
-    if kind is not None:
-        for key in _QIIME_PREFIXES:
-            if kind.startswith(key):
-                return _PREFIX_MAP[key]
+    if kind:
+        prefixed_kind = _PREFIXED_KIND_BY_INITIAL.get(kind[0])
+        if prefixed_kind is not None and kind.startswith(prefixed_kind[0]):
+            return prefixed_kind[1]
     return ""
 
 
 def format_qiime_option_label(option_prefix: str, name: str) -> str:
     dashed = name.replace("_", "-")
-    return f"--{option_prefix + '-' if option_prefix else ''}{dashed}"
+    if option_prefix:
+        return f"--{option_prefix}-{dashed}"
+    return f"--{dashed}"
 
 
 def option_label_matches_prefix(option_name: str, prefix_filter: str) -> bool:
@@ -129,11 +137,17 @@ def option_label_matches_prefix(option_name: str, prefix_filter: str) -> bool:
         return True
     if option_name.startswith(prefix_filter):
         return True
-    opt = option_name.lstrip("-")
-    pref = prefix_filter.lstrip("-")
-    if len(opt) >= 2 and opt[0] in {"i", "o", "p", "m"} and opt[1] == "-":
-        opt = opt[2:]
-    return opt.startswith(pref)
+    # Compare in place from the first character after the dashes and the
+    # optional QIIME i/o/p/m prefix instead of slicing the option name.
+    start = 0
+    while option_name.startswith("-", start):
+        start += 1
+    if (
+        option_name.startswith("-", start + 1)
+        and option_name[start] in _QIIME_OPTION_PREFIXES
+    ):
+        start += 2
+    return option_name.startswith(prefix_filter.lstrip("-"), start)
 
 
 def normalize_option_to_param_name(token_text: str) -> str | None:
@@ -141,12 +155,18 @@ def normalize_option_to_param_name(token_text: str) -> str | None:
     if not token_text.startswith("--"):
         return None
 
-    option_text, _ = split_inline_option_value(token_text)
-    option_name = option_text[2:].lower()
-    param_name = option_name.replace("-", "_")
-
-    parts = param_name.split("_", 1)
-    if len(parts) == 2 and parts[0] in _QIIME_OPTION_PREFIXES:
-        return parts[1]
+    option_end = token_text.find("=")
+    if option_end < 0:
+        option_end = len(token_text)
+    param_name = token_text[2:option_end].lower().replace("-", "_")
+
+    # Every QIIME prefix is one letter, so "x_" at the front is the only shape
+    # that can carry one; no need to split the whole name.
+    if (
+        len(param_name) > 1
+        and param_name[1] == "_"
+        and param_name[0] in _QIIME_OPTION_PREFIXES
+    ):
+        return param_name[2:]
 
     return param_name
@@ -3,16 +3,15 @@
 from __future__ import annotations
 
 import re
+import sys
 import threading
+from collections import OrderedDict
 from collections.abc import Callable, Mapping
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 import click as _click
-from q2cli.commands import PluginCommand as _PluginCommand
-from q2cli.commands import RootCommand as _RootCommand
 from q2lsp.qiime.catalog import QiimeCatalog
 from q2lsp.qiime.types import (
-    ActionCommandProperties,
     ActionSignatureParameter,
     BuiltinCommandProperties,
     CommandHierarchy,
@@ -27,70 +26,50 @@ __all__ = [
     "create_qiime_help_provider",
 ]
 
-
-def _normalize_param_name(name: str | None) -> str:
-    """Normalize a parameter name by replacing hyphens with underscores."""
-    return (name or "").replace("-", "_")
-
-
-def _option_default(opt: _click.Option) -> object | None:
-    """Get the default value for an option, excluding callable defaults."""
-    if opt.required:
-        return None
-    default_value = opt.default
-    if callable(default_value):
-        return None
-    return default_value
-
-
-def _option_type_name(opt: _click.Option) -> str:
-    """Get the type name for an option."""
-    return getattr(opt.type, "name", "") or opt.type.__class__.__name__
-
-
-def _click_option_to_signature_param(opt: _click.Option) -> ActionSignatureParameter:
-    """Convert a click Option to an ActionSignatureParameter dict."""
-    entry: ActionSignatureParameter = {
-        "name": _normalize_param_name(opt.name),
-        "type": _option_type_name(opt),
-        "description": opt.help or "",
-    }
-
-    default_value = _option_default(opt)
-    if default_value is not None:
-        entry["default"] = cast(JsonValue, default_value)
-
-    if opt.required:
-        entry["required"] = True
-
-    if opt.metavar is not None:
-        entry["metavar"] = opt.metavar
-
-    if opt.multiple:
-        entry["multiple"] = str(opt.multiple)
-
-    flag_value = getattr(opt, "flag_value", None)
-    bool_flag = (getattr(opt, "is_flag", False) and isinstance(flag_value, bool)) or (
-        getattr(opt, "secondary_opts", []) and isinstance(flag_value, bool)
-    )
-    if bool_flag:
-        entry["is_bool_flag"] = True
-
-    return entry
+if TYPE_CHECKING:
+    from q2cli.commands import PluginCommand as _PluginCommand
+    from q2cli.commands import RootCommand as _RootCommand
 
 
 def _extract_signature_from_click_command(
     command: _click.BaseCommand,
 ) -> list[ActionSignatureParameter]:
-    """Extract signature parameters from a click command."""
+    """Extract signature parameters from a click command's visible options."""
     signature: list[ActionSignatureParameter] = []
-    params = getattr(command, "params", [])
-    for param in params:
-        if not isinstance(param, _click.Option):
+    intern = sys.intern
+    for opt in getattr(command, "params", []):
+        if not isinstance(opt, _click.Option) or getattr(opt, "hidden", False):
             continue
-        if getattr(param, "hidden", False):
-            continue
-        signature.append(_click_option_to_signature_param(param))
+
+        option_type = opt.type
+        entry: ActionSignatureParameter = {
+            "name": intern((opt.name or "").replace("-", "_")),
+            "type": intern(
+                getattr(option_type, "name", "") or option_type.__class__.__name__
+            ),
+            "description": opt.help or "",
+        }
+
+        if opt.required:
+            entry["required"] = True
+        else:
+            # Callable defaults are computed lazily by click; they are not data.
+            default_value = opt.default
+            if default_value is not None and not callable(default_value):
+                entry["default"] = cast(JsonValue, default_value)
+
+        if opt.metavar is not None:
+            entry["metavar"] = opt.metavar
+
+        if opt.multiple:
+            entry["multiple"] = str(opt.multiple)
+
+        if isinstance(getattr(opt, "flag_value", None), bool) and (
+            getattr(opt, "is_flag", False) or getattr(opt, "secondary_opts", [])
+        ):
+            entry["is_bool_flag"] = True
+
+        signature.append(entry)
     return signature
 
 
@@ -98,6 +77,7 @@ def _build_builtin_command_node(
     builtin_name: str, builtin_command: _click.Command
 ) -> JsonObject:
     """Build a node for a builtin command, including its subcommands if any."""
+    builtin_name = sys.intern(builtin_name)
     builtin_properties: BuiltinCommandProperties = {
         "name": builtin_name,
         "help": getattr(builtin_command, "help", None),
@@ -113,6 +93,7 @@ def _build_builtin_command_node(
                 continue
             if not isinstance(subcommand, _click.Command):
                 continue
+            subcommand_name = sys.intern(subcommand_name)
             subcommand_properties: BuiltinCommandProperties = {
                 "name": subcommand_name,
                 "help": getattr(subcommand, "help", None),
@@ -138,14 +119,20 @@ def _build_plugin_nodes(root: _RootCommand, ctx: _click.Context) -> dict[str, Js
     plugin_lookup = cast(Mapping[str, PluginCommandProperties], root._plugin_lookup)
     nodes: dict[str, JsonObject] = {}
     for plugin_name, plugin_data in plugin_lookup.items():
+        plugin_name = sys.intern(plugin_name)
         plugin_command = _get_plugin_command(root, ctx, plugin_name)
-        action_lookup: dict[str, ActionCommandProperties] = dict(
-            plugin_command._action_lookup
+        # Action properties are stored as-is; only the plugin node is copied,
+        # since q2cli's own plugin lookup must not be mutated.
+        plugin_node = cast(JsonObject, plugin_data.copy())
+        plugin_node.update(
+            cast(Mapping[str, JsonObject], plugin_command._action_lookup)
+        )
+        plugin_node.update(
+            cast(
+                Mapping[str, JsonObject],
+                getattr(plugin_command, "_hidden_actions", {}),
+            )
         )
-        action_lookup.update(getattr(plugin_command, "_hidden_actions", {}))
-        plugin_node: JsonObject = cast(JsonObject, dict(plugin_data))
-        for action_name, action_data in action_lookup.items():
-            plugin_node[action_name] = cast(JsonObject, dict(action_data))
         nodes[plugin_name] = plugin_node
     return nodes
 
@@ -171,7 +158,11 @@ def _build_command_hierarchy_from_root(root: _RootCommand) -> CommandHierarchy:
 
 def build_qiime_hierarchy() -> CommandHierarchy:
     """Build the QIIME command hierarchy without exposing q2cli types."""
-    return _build_command_hierarchy_from_root(_RootCommand())
+    # Importing q2cli.commands loads the QIIME framework, so it is deferred
+    # until q2cli is actually queried.
+    from q2cli.commands import RootCommand
+
+    return _build_command_hierarchy_from_root(RootCommand())
 
 
 def build_qiime_catalog() -> QiimeCatalog:
@@ -182,16 +173,31 @@ def build_qiime_catalog() -> QiimeCatalog:
 def _get_plugin_command(
     root: _RootCommand, ctx: _click.Context, plugin_name: str
 ) -> _PluginCommand:
+    from q2cli.commands import PluginCommand
+
     command = root.get_command(ctx, plugin_name)
     if command is None:
         raise ValueError(f"Plugin command not found: {plugin_name}")
-    if not isinstance(command, _PluginCommand):
+    if not isinstance(command, PluginCommand):
         raise TypeError(
             f"Unexpected command type for {plugin_name}: {type(command).__name__}"
         )
     return command
 
 
+_HELP_CACHE_SIZE = 256
+
+# CSI escape sequences such as colors, line clears, cursor moves, and
+# private-mode toggles.
+_CSI_ESCAPE_RE = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]")
+
+# ASCII control characters (0x00-0x1F and DEL) except \t and \n, mapped to None
+# for deletion by str.translate.
+_CONTROL_CHARACTERS_TABLE = dict.fromkeys(
+    [code for code in range(32) if code not in (9, 10)] + [127]
+)
+
+
 def _sanitize_help_text(text: str) -> str:
     """
     Sanitize help text by removing control characters and ANSI escape sequences.
@@ -212,27 +218,13 @@ def _sanitize_help_text(text: str) -> str:
     Returns:
         Sanitized help text safe for LSP hover display.
     """
-    # Remove CSI escape sequences such as colors, line clears, cursor moves,
-    # and private-mode toggles.
-    ansi_pattern = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]")
-    text = ansi_pattern.sub("", text)
-
-    # Remove CRLF (normalize to LF)
-    text = text.replace("\r\n", "\n")
-
-    # Remove any remaining \r characters
-    text = text.replace("\r", "")
-
-    # Remove all ASCII control characters except \n and \t
-    # Control chars are in range 0x00-0x1F, plus 0x7F (DEL)
-    # We want to keep 0x0A (\n) and 0x09 (\t)
-    result = []
-    for char in text:
-        code = ord(char)
-        if (code < 32 and code not in (9, 10)) or code == 127:
-            continue
-        result.append(char)
-    return "".join(result)
+    # Strip escape sequences first; their ESC byte is itself a control char.
+    # Uncolored help has no ESC at all, and the substring test is far cheaper
+    # than letting the regex scan for one. Deleting every \r also normalizes
+    # CRLF to LF.
+    if "\x1b" in text:
+        text = _CSI_ESCAPE_RE.sub("", text)
+    return text.translate(_CONTROL_CHARACTERS_TABLE)
 
 
 # Singleton root command instance for lazy loading
@@ -245,9 +237,13 @@ def _get_root_command() -> _RootCommand:
     global _cached_root_command
     if _cached_root_command is None:
         with _root_command_lock:
-            # Double-check pattern
+            # Double-check pattern. Once set, callers never touch the lock;
+            # the lock only stops racing first calls from each running
+            # q2cli's plugin discovery, which functools.cache would allow.
             if _cached_root_command is None:
-                _cached_root_command = _RootCommand()
+                from q2cli.commands import RootCommand
+
+                _cached_root_command = RootCommand()
     return _cached_root_command
 
 
@@ -266,26 +262,58 @@ def create_qiime_help_provider(
 
     Returns:
         A callable that takes a command path and returns help text, or None.
+        Results are remembered per command path, since help text does not
+        change while the process runs.
     """
+    help_cache: OrderedDict[tuple[str, ...], str | None] = OrderedDict()
+    help_cache_lock = threading.Lock()
+    # Resolved plugin and builtin groups, so hovering another action of the
+    # same plugin does not rebuild the group command (q2cli creates a new
+    # command object on every get_command call).
+    group_cache: dict[tuple[str, ...], _click.MultiCommand] = {}
+    # Root of every context chain. Help rendering only reads it, so it is
+    # built on first use and shared by later renders.
+    root_ctx: _click.Context | None = None
 
     def _get_help(command_path: list[str]) -> str | None:
         """Get help text for the given command path."""
-        root = _get_root_command()
+        key = tuple(command_path)
+        with help_cache_lock:
+            if key in help_cache:
+                help_cache.move_to_end(key)
+                return help_cache[key]
+
+        help_text = _render_help(command_path)
+        with help_cache_lock:
+            help_cache[key] = help_text
+            if len(help_cache) > _HELP_CACHE_SIZE:
+                help_cache.popitem(last=False)
+        return help_text
+
+    def _render_help(command_path: list[str]) -> str | None:
+        nonlocal root_ctx
         # Build context chain with parent references for correct Usage lines
-        ctx = _click.Context(
-            root,
-            max_content_width=max_content_width,
-            color=color,
-            info_name="qiime",
-        )
+        ctx = root_ctx
+        if ctx is None:
+            ctx = root_ctx = _click.Context(
+                _get_root_command(),
+                max_content_width=max_content_width,
+                color=color,
+                info_name="qiime",
+            )
 
         # Navigate to the command
-        cmd: _click.Command = root
-        for name in command_path:
+        cmd: _click.Command = ctx.command
+        for depth, name in enumerate(command_path, start=1):
             if isinstance(cmd, _click.MultiCommand):
-                subcommand = cmd.get_command(ctx, name)
+                group_key = tuple(command_path[:depth])
+                subcommand = group_cache.get(group_key)
                 if subcommand is None:
-                    return None
+                    subcommand = cmd.get_command(ctx, name)
+                    if subcommand is None:
+                        return None
+                    if isinstance(subcommand, _click.MultiCommand):
+                        group_cache[group_key] = subcommand
                 cmd = subcommand
                 # Create new context with parent reference for proper command path
                 ctx = _click.Context(
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
-from typing import cast
+from typing import NamedTuple, cast
 
 from q2lsp.qiime.options import (
     format_qiime_option_label,
@@ -13,6 +13,64 @@ from q2lsp.qiime.options import (
 from q2lsp.qiime.types import ActionSignatureParameter, JsonObject
 
 
+class ActionSignature(NamedTuple):
+    """Column-wise view of an action's signature parameters.
+
+    Parallel tuples hold one entry per parameter, in signature order.
+    Boolean attributes are packed into bitmasks where bit ``i`` belongs to
+    parameter ``i``. ``folded_option_labels`` holds the lowercased labels, so
+    a case-insensitive exact check is one set lookup, and
+    ``required_param_options`` pairs each required parameter's lowercased
+    name with its option label.
+    """
+
+    param_names: tuple[str, ...] = ()
+    option_labels: tuple[str, ...] = ()
+    required_mask: int = 0
+    bool_flag_mask: int = 0
+    folded_option_labels: frozenset[str] = frozenset()
+    required_param_options: tuple[tuple[str, str], ...] = ()
+
+
+def build_action_signature(action_node: JsonObject) -> ActionSignature:
+    """Collect an action node's signature into an ActionSignature."""
+    param_names: list[str] = []
+    option_labels: list[str] = []
+    required_param_options: dict[str, str] = {}
+    required_mask = 0
+    bool_flag_mask = 0
+    for index, (param_name, prefix, param) in enumerate(
+        iter_signature_params(action_node)
+    ):
+        param_names.append(param_name)
+        option_label = format_qiime_option_label(prefix, param_name)
+        option_labels.append(option_label)
+        if param_is_required(param):
+            required_mask |= 1 << index
+            required_param_options[param_name.lower()] = option_label
+        if param.get("is_bool_flag") is True:
+            bool_flag_mask |= 1 << index
+
+    return ActionSignature(
+        param_names=tuple(param_names),
+        option_labels=tuple(option_labels),
+        required_mask=required_mask,
+        bool_flag_mask=bool_flag_mask,
+        folded_option_labels=frozenset(label.lower() for label in option_labels),
+        required_param_options=tuple(required_param_options.items()),
+    )
+
+
+def signature_param_is_required(signature: ActionSignature, index: int) -> bool:
+    """Return whether parameter ``index`` of the signature is required."""
+    return bool(signature.required_mask >> index & 1)
+
+
+def signature_param_is_bool_flag(signature: ActionSignature, index: int) -> bool:
+    """Return whether parameter ``index`` of the signature is a boolean flag."""
+    return bool(signature.bool_flag_mask >> index & 1)
+
+
 def get_all_option_labels(action_node: JsonObject) -> list[str]:
     """
     Extract valid option labels from action node signature.
@@ -26,20 +84,17 @@ def get_all_option_labels(action_node: JsonObject) -> list[str]:
     Returns:
         List of valid option labels (e.g., ['--i-table', '--m-metadata-file']).
     """
-    return [
-        format_qiime_option_label(prefix, param_name)
-        for param_name, prefix, _param in iter_signature_params(action_node)
-    ]
+    return list(build_action_signature(action_node).option_labels)
 
 
 def get_required_option_labels(action_node: JsonObject) -> list[str]:
     """Extract required option labels from action node signature."""
-    required_options: list[str] = []
-    for param_name, prefix, param in iter_signature_params(action_node):
-        if param_is_required(param):
-            required_options.append(format_qiime_option_label(prefix, param_name))
-
-    return required_options
+    signature = build_action_signature(action_node)
+    return [
+        label
+        for index, label in enumerate(signature.option_labels)
+        if signature_param_is_required(signature, index)
+    ]
 
 
 def iter_signature_params(
@@ -58,37 +113,23 @@ def iter_signature_params(
         Tuples of (param_name, option_prefix, param_dict).
     """
     signature = action_node.get("signature")
-    if signature is None:
-        return
-
     if isinstance(signature, list):
-        for param in signature:
-            if not isinstance(param, dict):
-                continue
-            typed_param = cast(ActionSignatureParameter, param)
-
-            param_name = typed_param.get("name")
-            if not isinstance(param_name, str) or not param_name:
-                continue
-
-            prefix = qiime_option_prefix(typed_param)
-            yield (param_name, prefix, typed_param)
+        param_lists = [signature]
+    elif isinstance(signature, dict):
+        param_lists = [
+            params
+            for param_type in ["inputs", "outputs", "parameters", "metadata"]
+            if isinstance(params := signature.get(param_type), list)
+        ]
+    else:
         return
 
-    if isinstance(signature, dict):
-        for param_type in ["inputs", "outputs", "parameters", "metadata"]:
-            params = signature.get(param_type)
-            if not isinstance(params, list):
+    # One cast per list rather than per parameter; cast is still a call at
+    # runtime. Malformed entries are skipped by the checks below.
+    for params in cast(list[list[ActionSignatureParameter]], param_lists):
+        for param in params:
+            if not isinstance(param, dict):
                 continue
-
-            for param in params:
-                if not isinstance(param, dict):
-                    continue
-                typed_param = cast(ActionSignatureParameter, param)
-
-                param_name = typed_param.get("name")
-                if not isinstance(param_name, str) or not param_name:
-                    continue
-
-                prefix = qiime_option_prefix(typed_param)
-                yield (param_name, prefix, typed_param)
+            param_name = param.get("name")
+            if isinstance(param_name, str) and param_name:
+                yield (param_name, qiime_option_prefix(param), param)
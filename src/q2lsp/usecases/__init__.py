@@ -1,8 +1,15 @@
 """Application use cases."""
 
 from q2lsp.usecases.get_completions_usecase import (
+    CompletionProvider,
     CompletionRequest,
     get_completions,
+    make_cached_completions,
 )
 
-__all__ = ["CompletionRequest", "get_completions"]
+__all__ = [
+    "CompletionProvider",
+    "CompletionRequest",
+    "get_completions",
+    "make_cached_completions",
+]
@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
-from typing import NamedTuple
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple, TypeAlias
 
 from q2lsp.adapters.completion_adapter import (
     to_completion_data,
     to_completion_query,
 )
 from q2lsp.core.completion_engine import get_completions as get_core_completions
-from q2lsp.core.types import CompletionItem
+from q2lsp.core.completion_engine import index_completion_data
+from q2lsp.core.types import (
+    CompletionData,
+    CompletionItem,
+    CompletionMode,
+    CompletionModeName,
+    CompletionQuery,
+)
 from q2lsp.qiime.catalog import QiimeCatalog
 
+_NARROWED_DATA_CACHE_SIZE = 64
+
+_ParentPathKey: TypeAlias = tuple[CompletionModeName, str, str]
+
 
 class CompletionRequest(NamedTuple):
     """Boundary input for completion usecase."""
@@ -21,15 +34,102 @@ class CompletionRequest(NamedTuple):
     command_tokens: tuple[str, ...]
 
 
+CompletionProvider: TypeAlias = Callable[
+    [CompletionRequest, QiimeCatalog], list[CompletionItem]
+]
+
+
+class _CompletionDataEntry(NamedTuple):
+    catalog: QiimeCatalog
+    data: CompletionData
+    narrowed: OrderedDict[_ParentPathKey, CompletionData]
+
+
 def get_completions(
     request: CompletionRequest,
     catalog: QiimeCatalog,
 ) -> list[CompletionItem]:
     """Return completion suggestions from boundary request and command catalog."""
-    query = to_completion_query(
+    query = _to_completion_query(request)
+    return get_core_completions(query, to_completion_data(catalog))
+
+
+def make_cached_completions() -> CompletionProvider:
+    """Create a completion function that reuses data derived from the catalog.
+
+    Catalogs are immutable and normally live for the whole server session, so
+    the normalized completion data and its label indexes are rebuilt only
+    when a different catalog instance is passed in.
+    """
+    entry: _CompletionDataEntry | None = None
+
+    def complete(
+        request: CompletionRequest, catalog: QiimeCatalog
+    ) -> list[CompletionItem]:
+        nonlocal entry
+        if entry is None or entry.catalog is not catalog:
+            entry = _CompletionDataEntry(
+                catalog=catalog,
+                data=index_completion_data(to_completion_data(catalog)),
+                narrowed=OrderedDict(),
+            )
+
+        query = _to_completion_query(request)
+        return get_core_completions(query, _get_parent_path_data(entry, query))
+
+    return complete
+
+
+def _to_completion_query(request: CompletionRequest) -> CompletionQuery:
+    return to_completion_query(
         mode=request.mode,
         prefix=request.prefix,
         command_tokens=request.command_tokens,
     )
-    data = to_completion_data(catalog)
-    return get_core_completions(query, data)
+
+
+def _get_parent_path_data(
+    entry: _CompletionDataEntry, query: CompletionQuery
+) -> CompletionData:
+    """Return completion data narrowed to the query's plugin/action path.
+
+    Keystrokes within one token only change the prefix, so the narrowed data
+    is cached per (mode, plugin, action) and prefix filtering is left to the
+    core engine.
+    """
+    if query.mode not in (CompletionMode.PLUGIN, CompletionMode.PARAMETER):
+        return entry.data
+
+    key: _ParentPathKey = (query.mode, query.plugin_name, query.action_name)
+    narrowed = entry.narrowed.get(key)
+    if narrowed is not None:
+        entry.narrowed.move_to_end(key)
+        return narrowed
+
+    narrowed = _narrow_completion_data(entry.data, query)
+    entry.narrowed[key] = narrowed
+    if len(entry.narrowed) > _NARROWED_DATA_CACHE_SIZE:
+        entry.narrowed.popitem(last=False)
+    return narrowed
+
+
+def _narrow_completion_data(
+    data: CompletionData, query: CompletionQuery
+) -> CompletionData:
+    command = next(
+        (command for command in data.commands if command.name == query.plugin_name),
+        None,
+    )
+    if command is None:
+        return CompletionData()
+
+    if query.mode == CompletionMode.PARAMETER:
+        actions = tuple(
+            action
+            for action in command.actions
+            if action.item.label == query.action_name
+        )[:1]
+        # The action index refers to positions in the full action tuple.
+        command = command._replace(actions=actions, action_index=None)
+
+    return CompletionData(commands=(command,))
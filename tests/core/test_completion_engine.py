@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from q2lsp.core.completion_engine import get_completions
+from q2lsp.core.completion_engine import get_completions, index_completion_data
 from q2lsp.core.types import (
     ActionCandidate,
     CommandCandidate,
@@ -15,6 +15,13 @@ from q2lsp.core.types import (
 )
 
 
+def test_completion_mode_and_kind_members_are_plain_strings() -> None:
+    assert type(CompletionMode.ROOT) is str
+    assert type(CompletionKind.ACTION) is str
+    assert str(CompletionMode.PARAMETER) == "parameter"
+    assert CompletionKind.BUILTIN == "builtin"
+
+
 def test_none_completion_returns_empty_list() -> None:
     data = CompletionData(
         root_items=(
@@ -53,6 +60,61 @@ def test_root_completion_returns_plugins_and_builtins() -> None:
     assert labels == {"info", "feature-table"}
 
 
+def test_root_completion_prefix_keeps_input_order_across_queries() -> None:
+    labels = ("feature-table", "info", "feature-classifier", "fragment-insertion")
+    data = CompletionData(
+        root_items=tuple(
+            CompletionItem(label=label, detail="", kind=CompletionKind.PLUGIN)
+            for label in labels
+        )
+    )
+
+    def complete(prefix: str) -> list[str]:
+        query = CompletionQuery(mode=CompletionMode.ROOT, prefix=prefix)
+        return [item.label for item in get_completions(query, data)]
+
+    assert complete("fe") == ["feature-table", "feature-classifier"]
+    assert complete("f") == ["feature-table", "feature-classifier", "fragment-insertion"]
+    assert complete("feature-c") == ["feature-classifier"]
+    assert complete("x") == []
+
+
+def test_indexed_data_matches_unindexed_root_and_plugin_completion() -> None:
+    actions = ("summarize", "filter-samples", "filter-features", "merge")
+    data = CompletionData(
+        root_items=tuple(
+            CompletionItem(label=label, detail="", kind=CompletionKind.PLUGIN)
+            for label in ("feature-table", "info", "feature-classifier")
+        ),
+        commands=(
+            CommandCandidate(
+                name="feature-table",
+                is_builtin=False,
+                actions=tuple(
+                    ActionCandidate(
+                        item=CompletionItem(
+                            label=label, detail="", kind=CompletionKind.ACTION
+                        )
+                    )
+                    for label in actions
+                ),
+            ),
+        ),
+    )
+    indexed = index_completion_data(data)
+
+    assert indexed.root_index is not None
+    assert indexed.commands[0].action_index is not None
+    for prefix in ("", "f", "feature-c", "filter", "m", "x"):
+        for query in (
+            CompletionQuery(mode=CompletionMode.ROOT, prefix=prefix),
+            CompletionQuery(
+                mode=CompletionMode.PLUGIN, prefix=prefix, plugin_name="feature-table"
+            ),
+        ):
+            assert get_completions(query, indexed) == get_completions(query, data)
+
+
 def test_plugin_action_completion_filters_by_prefix() -> None:
     data = CompletionData(
         commands=(
@@ -254,6 +316,101 @@ def test_parameter_completion_matches_bare_prefix() -> None:
     assert {item.label for item in items} == {"--o-output-dir"}
 
 
+def test_parameter_completion_keeps_signature_order_without_duplicates() -> None:
+    def parameter(name: str, label: str) -> ParameterCandidate:
+        return ParameterCandidate(
+            name=name,
+            item=CompletionItem(label=label, detail="", kind=CompletionKind.PARAMETER),
+            match_texts=(label, label[2:], label[4:]),
+        )
+
+    summarize = ActionCandidate(
+        item=CompletionItem(
+            label="summarize",
+            detail="Summarize a feature table",
+            kind=CompletionKind.ACTION,
+        ),
+        parameters=(
+            parameter("taxonomy", "--i-taxonomy"),
+            parameter("p_table", "--p-table"),
+            parameter("table", "--i-table"),
+            parameter("depth", "--p-depth"),
+        ),
+    )
+    data = CompletionData(
+        commands=(
+            CommandCandidate(
+                name="feature-table",
+                is_builtin=False,
+                actions=(summarize,),
+            ),
+        )
+    )
+    query = CompletionQuery(
+        mode=CompletionMode.PARAMETER,
+        prefix="t",
+        normalized_prefix="t",
+        plugin_name="feature-table",
+        action_name="summarize",
+        used_parameters=frozenset({"table"}),
+    )
+
+    items = get_completions(query, data)
+
+    assert [item.label for item in items] == ["--i-taxonomy", "--p-table"]
+
+
+def test_indexed_data_matches_unindexed_parameter_completion() -> None:
+    def parameter(name: str, label: str) -> ParameterCandidate:
+        return ParameterCandidate(
+            name=name,
+            item=CompletionItem(label=label, detail="", kind=CompletionKind.PARAMETER),
+            match_texts=(label, label[2:], label[4:]),
+        )
+
+    summarize = ActionCandidate(
+        item=CompletionItem(label="summarize", detail="", kind=CompletionKind.ACTION),
+        parameters=(
+            parameter("taxonomy", "--i-taxonomy"),
+            parameter("p_table", "--p-table"),
+            parameter("table", "--i-table"),
+            parameter("depth", "--p-depth"),
+        ),
+    )
+    data = CompletionData(
+        commands=(
+            CommandCandidate(
+                name="feature-table",
+                is_builtin=False,
+                actions=(summarize,),
+            ),
+        )
+    )
+    indexed = index_completion_data(data)
+
+    indexed_action = indexed.commands[0].actions[0]
+    assert indexed_action.parameter_index is not None
+    assert indexed_action.match_text_index is not None
+    for prefix, normalized in (
+        ("", ""),
+        ("--", ""),
+        ("--i", "i"),
+        ("--p-t", "p-t"),
+        ("t", "t"),
+        ("de", "de"),
+        ("x", "x"),
+    ):
+        query = CompletionQuery(
+            mode=CompletionMode.PARAMETER,
+            prefix=prefix,
+            normalized_prefix=normalized,
+            plugin_name="feature-table",
+            action_name="summarize",
+            used_parameters=frozenset({"table"}),
+        )
+        assert get_completions(query, indexed) == get_completions(query, data)
+
+
 def test_parameter_completion_excludes_used_help() -> None:
     summarize = ActionCandidate(
         item=CompletionItem(
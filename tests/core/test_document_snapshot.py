@@ -97,3 +97,17 @@ def test_offset_mapper_clamps_line_beyond_end_to_eof() -> None:
     mapper = OffsetMapper("qiime\ninfo")
 
     assert mapper.position_to_offset(99, 0) == 10
+
+
+def test_offset_mapper_resolves_lines_across_mixed_line_breaks() -> None:
+    mapper = OffsetMapper("ab\r\ncd\ref\ngh")
+
+    assert [mapper.position_to_offset(line, 1) for line in range(4)] == [1, 5, 8, 11]
+    assert mapper.position_to_offset(2, 999) == 9
+
+
+def test_offset_mapper_maps_offsets_on_later_lines_with_utf16_columns() -> None:
+    mapper = OffsetMapper("ab\n😀x\r\ny")
+
+    assert mapper.offset_to_position(5) == (1, 3)
+    assert mapper.offset_to_position(7) == (2, 0)
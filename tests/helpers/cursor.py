@@ -34,27 +34,13 @@ def extract_cursor(
     Raises:
         ValueError: If marker appears zero or more than one time.
     """
-    count = text_with_cursor.count(marker)
-    if count == 0:
-        raise ValueError(f"Cursor marker '{marker}' not found in text")
-    if count > 1:
-        raise ValueError(
-            f"Multiple cursor markers '{marker}' found in text (expected exactly 1)"
-        )
-
-    # Find marker position
-    marker_index = text_with_cursor.index(marker)
+    before, after = _split_at_marker(text_with_cursor, marker)
 
     # Calculate line and character
-    text_before_cursor = text_with_cursor[:marker_index]
-    lines_before = text_before_cursor.split("\n")
-    line = len(lines_before) - 1
-    character = len(lines_before[-1])
-
-    # Remove marker from text
-    cleaned_text = text_with_cursor.replace(marker, "", 1)
+    line = before.count("\n")
+    character = len(before) - before.rfind("\n") - 1
 
-    return cleaned_text, Position(line=line, character=character)
+    return before + after, Position(line=line, character=character)
 
 
 def extract_cursor_offset(
@@ -77,18 +63,21 @@ def extract_cursor_offset(
     Raises:
         ValueError: If marker appears zero or more than one time.
     """
-    count = text_with_cursor.count(marker)
-    if count == 0:
-        raise ValueError(f"Cursor marker '{marker}' not found in text")
-    if count > 1:
-        raise ValueError(
-            f"Multiple cursor markers '{marker}' found in text (expected exactly 1)"
-        )
-
-    # Find marker position (this is the offset)
-    offset = text_with_cursor.index(marker)
-
-    # Remove marker from text
-    cleaned_text = text_with_cursor.replace(marker, "", 1)
-
-    return cleaned_text, offset
+    before, after = _split_at_marker(text_with_cursor, marker)
+
+    # The text before the marker ends at the offset
+    return before + after, len(before)
+
+
+def _split_at_marker(text_with_cursor: str, marker: str) -> tuple[str, str]:
+    """Split text around its only marker, raising ValueError otherwise."""
+    # An empty marker matches at every offset, so it is never unique.
+    if marker:
+        before, found, after = text_with_cursor.partition(marker)
+        if not found:
+            raise ValueError(f"Cursor marker '{marker}' not found in text")
+        if marker not in after:
+            return before, after
+    raise ValueError(
+        f"Multiple cursor markers '{marker}' found in text (expected exactly 1)"
+    )
@@ -5,38 +5,38 @@ from __future__ import annotations
 import subprocess
 import sys
 
-import pytest
+IMPORT_TIMEOUT_SECONDS = 10
 
 
-IMPORT_TIMEOUT_SECONDS = 10
+# Both import orders run in one interpreter; every q2lsp module is dropped
+# from sys.modules before each order so every import starts cold. Each order
+# is announced on stderr, so a failure shows which one broke.
+IMPORT_ORDERS = [
+    ("q2lsp.lsp.diagnostics.validator", "q2lsp.lsp.diagnostics.stages"),
+    ("q2lsp.lsp.diagnostics.stages", "q2lsp.lsp.diagnostics.validator"),
+]
 
 
-@pytest.mark.parametrize(
-    ("first_module", "second_module"),
-    [
-        (
-            "q2lsp.lsp.diagnostics.validator",
-            "q2lsp.lsp.diagnostics.stages",
-        ),
-        (
-            "q2lsp.lsp.diagnostics.stages",
-            "q2lsp.lsp.diagnostics.validator",
-        ),
-    ],
-    ids=["validator_then_stages", "stages_then_validator"],
-)
-def test_diagnostics_submodules_cold_import_without_circular_dependencies(
-    first_module: str, second_module: str
-) -> None:
+def test_diagnostics_submodules_cold_import_without_circular_dependencies() -> None:
     command = "\n".join(
         [
             "import importlib",
-            "importlib.import_module('q2lsp.lsp.diagnostics.diagnostic_issue')",
-            "from q2lsp.lsp.diagnostics import "
+            "import sys",
+            "def cold_import(first_module, second_module):",
+            "    print('order:', first_module, second_module, file=sys.stderr)",
+            "    for name in list(sys.modules):",
+            "        if name == 'q2lsp' or name.startswith('q2lsp.'):",
+            "            del sys.modules[name]",
+            "    importlib.import_module('q2lsp.lsp.diagnostics.diagnostic_issue')",
+            "    from q2lsp.lsp.diagnostics import "
             "DebounceManager, DiagnosticIssue, validate_command_with_catalog",
-            f"importlib.import_module('{first_module}')",
-            f"importlib.import_module('{second_module}')",
-            "importlib.import_module('q2lsp.lsp.diagnostics.matching')",
+            "    importlib.import_module(first_module)",
+            "    importlib.import_module(second_module)",
+            "    importlib.import_module('q2lsp.lsp.diagnostics.matching')",
+            *(
+                f"cold_import({first_module!r}, {second_module!r})"
+                for first_module, second_module in IMPORT_ORDERS
+            ),
         ]
     )
 
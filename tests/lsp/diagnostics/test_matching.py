@@ -0,0 +1,25 @@
+"""Tests for diagnostics matching helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from q2lsp.lsp.diagnostics.matching import _is_exact_match
+
+
+@pytest.mark.parametrize(
+    ("token_text", "candidates", "expected"),
+    [
+        ("info", ["info", "tools"], True),
+        ("INFO", ["info", "tools"], True),
+        ("info", {"Info", "tools"}, True),
+        ("inf", ["info", "tools"], False),
+        ("information", ["info", "tools"], False),
+        ("diversity", ["info", "tools"], False),
+        ("info", [], False),
+    ],
+)
+def test_is_exact_match(
+    token_text: str, candidates: list[str] | set[str], expected: bool
+) -> None:
+    assert _is_exact_match(token_text, candidates) is expected
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import copy
+
 import pytest
 
 from q2lsp.lsp.diagnostics import codes
 from q2lsp.lsp.diagnostics.diagnostic_issue import DiagnosticIssue
-from q2lsp.lsp.diagnostics.validator import validate_command_with_catalog
+from q2lsp.lsp.diagnostics.validator import (
+    make_cached_command_validator,
+    validate_command_with_catalog,
+)
 from q2lsp.lsp.types import ParsedCommand, TokenSpan
 from q2lsp.qiime.catalog import QiimeCatalog
 from q2lsp.qiime.types import CommandHierarchy
@@ -18,9 +23,17 @@ def validate_command_with_hierarchy(
     return validate_command_with_catalog(command, QiimeCatalog.from_hierarchy(hierarchy))
 
 
-@pytest.fixture
+def _command(tokens: list[TokenSpan]) -> ParsedCommand:
+    """Build a ParsedCommand spanning exactly the given tokens."""
+    return ParsedCommand(tokens=tokens, start=tokens[0].start, end=tokens[-1].end)
+
+
+@pytest.fixture(scope="module")
 def hierarchy_with_plugins_and_builtins() -> dict:
-    """Hierarchy with plugins and builtins for testing."""
+    """Hierarchy with plugins and builtins for testing.
+
+    Shared by every test in the module; tests that modify it work on a copy.
+    """
     return {
         "qiime": {
             "name": "qiime",
@@ -150,8 +163,8 @@ class TestValidateCommand:
             TokenSpan("summarize", 20, 29),
             TokenSpan("--bad-option", 30, 42),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=42)
-        hierarchy = hierarchy_with_plugins_and_builtins
+        cmd = _command(tokens)
+        hierarchy = copy.deepcopy(hierarchy_with_plugins_and_builtins)
         hierarchy["qiime"]["feature-table"]["summarize"] = {
             "id": "summarize",
             "name": "summarize",
@@ -178,7 +191,7 @@ class TestValidateCommand:
             TokenSpan("--i-table", 30, 39),
             TokenSpan("table.qza", 40, 49),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=49)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert issues == []
 
@@ -188,13 +201,12 @@ class TestValidateCommand:
             TokenSpan("feature-tabel", 6, 19),  # typo: tabel instead of table
             TokenSpan("summarize", 20, 29),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=29)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert len(issues) == 1
         assert "feature-tabel" in issues[0].message
         assert "Did you mean" in issues[0].message
-        assert issues[0].start == 6
-        assert issues[0].end == 19
+        assert (issues[0].start, issues[0].end) == (6, 19)
 
     def test_typo_in_builtin(self, hierarchy_with_plugins_and_builtins: dict) -> None:
         tokens = [
@@ -202,7 +214,7 @@ class TestValidateCommand:
             TokenSpan("inof", 6, 10),  # typo: inof instead of info
             TokenSpan("refresh-cache", 11, 25),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=25)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert len(issues) == 1
         assert "inof" in issues[0].message
@@ -214,7 +226,7 @@ class TestValidateCommand:
             TokenSpan("feature-table", 6, 19),
             TokenSpan("summerize", 20, 29),  # typo: summerize instead of summarize
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=29)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert len(issues) == 1
         assert "summerize" in issues[0].message
@@ -227,7 +239,7 @@ class TestValidateCommand:
             TokenSpan("feat-tabel", 6, 17),  # typo in plugin
             TokenSpan("sumerize", 18, 27),  # typo in action
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=27)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         # Only 1 issue because token1 is invalid - we don't validate token2
         # to avoid noise since action candidates are unknown
@@ -241,7 +253,7 @@ class TestValidateCommand:
             TokenSpan("feat", 6, 10),  # prefix of "feature-table"
             TokenSpan("sum", 11, 14),  # prefix of "summarize"
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=14)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         # Should have issues for both prefix tokens
         assert len(issues) == 2
@@ -259,7 +271,7 @@ class TestValidateCommand:
             TokenSpan("FEAT", 6, 10),  # prefix (uppercase) of "feature-table"
             TokenSpan("Sum", 11, 14),  # prefix (capitalized) of "summarize"
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=14)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         # Should have issues for both prefix tokens
         assert len(issues) == 2
@@ -277,7 +289,7 @@ class TestValidateCommand:
             TokenSpan("metadata", 6, 14),
             TokenSpan("tabul", 15, 20),  # prefix of "tabulate"
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=20)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert len(issues) == 1
         assert "tabul" in issues[0].message
@@ -289,7 +301,7 @@ class TestValidateCommand:
     ) -> None:
         # Commands with less than 3 tokens should not be validated
         tokens = [TokenSpan("qiime", 0, 5)]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=5)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert issues == []
 
@@ -302,7 +314,7 @@ class TestValidateCommand:
             TokenSpan("xyz123", 6, 12),  # completely unknown
             TokenSpan("summarize", 13, 22),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=22)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert len(issues) == 1
         assert "xyz123" in issues[0].message
@@ -318,7 +330,7 @@ class TestValidateCommand:
             TokenSpan("feature-table", 6, 19),
             TokenSpan("xyz123", 20, 26),  # completely unknown
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=26)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert len(issues) == 1
         assert "xyz123" in issues[0].message
@@ -333,12 +345,11 @@ class TestValidateCommand:
             TokenSpan("qiime", 0, 5),
             TokenSpan("toolss", 6, 12),  # typo: should be "tools"
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=12)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert len(issues) == 1
         assert "toolss" in issues[0].message
-        assert issues[0].start == 6
-        assert issues[0].end == 12
+        assert (issues[0].start, issues[0].end) == (6, 12)
 
     def test_option_like_tokens_suppress_diagnostics(
         self, hierarchy_with_plugins_and_builtins: dict
@@ -349,7 +360,7 @@ class TestValidateCommand:
             TokenSpan("qiime", 0, 5),
             TokenSpan("--help", 6, 12),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=12)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert issues == []
 
@@ -359,7 +370,7 @@ class TestValidateCommand:
             TokenSpan("tools", 6, 11),
             TokenSpan("--help", 12, 18),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=18)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert issues == []
 
@@ -369,7 +380,7 @@ class TestValidateCommand:
             TokenSpan("tools", 6, 11),
             TokenSpan("-h", 12, 14),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=14)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert issues == []
 
@@ -383,7 +394,7 @@ class TestValidateCommand:
             TokenSpan("info", 6, 10),
             TokenSpan("something", 11, 20),  # should not be validated
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=20)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         # Only one issue possible for token1, but "info" is valid so no issues
         assert issues == []
@@ -397,12 +408,11 @@ class TestValidateCommand:
             TokenSpan("inof", 6, 10),  # typo for "info"
             TokenSpan("something", 11, 20),  # should not be validated
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=20)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert len(issues) == 1
         assert "inof" in issues[0].message
-        assert issues[0].start == 6
-        assert issues[0].end == 10
+        assert (issues[0].start, issues[0].end) == (6, 10)
 
 
 class TestValidateOptions:
@@ -419,15 +429,14 @@ class TestValidateOptions:
             TokenSpan("summarize", 20, 29),
             TokenSpan("--i-tabel", 30, 39),  # typo: tabel instead of table
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=39)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert len(issues) == 1
         assert "--i-tabel" in issues[0].message
         assert "Did you mean" in issues[0].message
         assert "'--i-table'" in issues[0].message
         assert issues[0].code == "q2lsp-dni/unknown-option"
-        assert issues[0].start == 30
-        assert issues[0].end == 39
+        assert (issues[0].start, issues[0].end) == (30, 39)
 
     def test_option_prefix_emits_issue(
         self, hierarchy_with_plugins_and_builtins: dict
@@ -440,7 +449,7 @@ class TestValidateOptions:
             TokenSpan("summarize", 20, 29),
             TokenSpan("--i-ta", 30, 36),  # prefix of --i-table
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=36)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert len(issues) == 1
         assert "--i-ta" in issues[0].message
@@ -459,7 +468,7 @@ class TestValidateOptions:
             TokenSpan("summarize", 20, 29),
             TokenSpan("--i-table=foo", 30, 43),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=43)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert issues == []
 
@@ -497,7 +506,7 @@ class TestValidateRequiredOptions:
             TokenSpan("metadata", 6, 14),
             TokenSpan("tabulate", 15, 23),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=23)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy)
 
         missing = [
@@ -518,14 +527,13 @@ class TestValidateRequiredOptions:
             TokenSpan("--p-obs-metadata", 30, 46),
             TokenSpan("foo", 47, 50),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=50)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         assert len(issues) == 1
         assert issues[0].code == "q2lsp-dni/missing-required-option"
         assert "--i-table" in issues[0].message
-        assert issues[0].start == 20
-        assert issues[0].end == 29
+        assert (issues[0].start, issues[0].end) == (20, 29)
 
     def test_all_required_options_present_no_diagnostic(
         self, hierarchy_with_plugins_and_builtins: dict
@@ -536,8 +544,10 @@ class TestValidateRequiredOptions:
             TokenSpan("summarize", 20, 29),
             TokenSpan("--i-table", 30, 39),
             TokenSpan("table.qza", 40, 49),
+            TokenSpan("--p-obs-metadata", 50, 66),
+            TokenSpan("foo", 67, 70),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=49)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         assert issues == []
@@ -552,7 +562,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--i-table", 30, 39),
             TokenSpan("table.qza", 40, 49),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=49)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         assert issues == []
@@ -566,7 +576,7 @@ class TestValidateRequiredOptions:
             TokenSpan("summarize", 20, 29),
             TokenSpan("--help", 30, 36),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=36)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         assert issues == []
@@ -580,7 +590,7 @@ class TestValidateRequiredOptions:
             TokenSpan("summarize", 20, 29),
             TokenSpan("-h", 30, 32),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=32)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         assert issues == []
@@ -595,7 +605,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--p-obs-metadata", 30, 46),
             TokenSpan("-h", 47, 49),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=49)
+        cmd = _command(tokens)
         issues = validate_command(cmd, hierarchy_with_plugins_and_builtins)
 
         missing = [
@@ -617,7 +627,7 @@ class TestValidateRequiredOptions:
             TokenSpan("foo", 47, 50),
             TokenSpan("-h", 51, 53),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=53)
+        cmd = _command(tokens)
         issues = validate_command(cmd, hierarchy_with_plugins_and_builtins)
 
         assert issues == []
@@ -654,7 +664,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--verbose", 36, 45),
             TokenSpan("-h", 46, 48),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=48)
+        cmd = _command(tokens)
         issues = validate_command(cmd, hierarchy)
 
         assert issues == []
@@ -668,7 +678,7 @@ class TestValidateRequiredOptions:
             TokenSpan("summarize", 20, 29),
             TokenSpan("--help=1", 30, 38),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=38)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         assert issues == []
@@ -682,7 +692,7 @@ class TestValidateRequiredOptions:
             TokenSpan("summarize", 20, 29),
             TokenSpan("--i-table=table.qza", 30, 49),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=49)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         assert issues == []
@@ -697,7 +707,7 @@ class TestValidateRequiredOptions:
             TokenSpan("summarize", 20, 29),
             TokenSpan("--i-table", 30, 39),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=39)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         assert issues == []
@@ -734,7 +744,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--p-sample-axis", 50, 65),
             TokenSpan("sample", 66, 72),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=72)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy)
 
         assert issues == []
@@ -769,7 +779,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--p-sample-axis", 30, 45),
             TokenSpan("sample", 46, 52),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=52)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy)
 
         missing_required_issues = [
@@ -790,7 +800,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--table", 30, 37),
             TokenSpan("table.qza", 38, 47),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=47)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         unknown_option_issues = [
@@ -816,7 +826,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--I-TABLE", 30, 39),
             TokenSpan("table.qza", 40, 49),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=49)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         assert issues == []
@@ -864,7 +874,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--format", 19, 27),
             TokenSpan("csv", 28, 31),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=31)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy)
 
         missing = [
@@ -873,9 +883,9 @@ class TestValidateRequiredOptions:
             if issue.code == "q2lsp-dni/missing-required-option"
         ]
         assert len(missing) == 2
-        missing_messages = {issue.message for issue in missing}
-        assert any("--input-path" in message for message in missing_messages)
-        assert any("--output-path" in message for message in missing_messages)
+        missing_messages = "\n".join(issue.message for issue in missing)
+        assert "--input-path" in missing_messages
+        assert "--output-path" in missing_messages
 
     def test_builtin_optional_none_default_no_false_positive(self) -> None:
         """Builtin param without required flag and no default key is NOT treated as required."""
@@ -907,7 +917,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--verbose", 19, 28),
             TokenSpan("true", 29, 33),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=33)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy)
 
         missing = [
@@ -946,7 +956,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--p-verbose", 36, 47),
             TokenSpan("true", 48, 52),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=52)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy)
 
         missing = [
@@ -990,7 +1000,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--i-metadata", 24, 36),
             TokenSpan("foo", 37, 40),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=40)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy)
 
         missing = [
@@ -1011,7 +1021,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--p-where", 35, 44),
             TokenSpan("some condition", 45, 59),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=59)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         required_issues = [
@@ -1031,7 +1041,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--i-tabel", 30, 39),
             TokenSpan("table.qza", 40, 49),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=49)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         unknown_option_issues = [
@@ -1076,7 +1086,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--p-foo", 36, 43),
             TokenSpan("bar", 44, 47),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=47)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy)
 
         missing_required_issues = [
@@ -1096,7 +1106,7 @@ class TestValidateRequiredOptions:
             TokenSpan("summerize", 20, 29),  # typo for summarize
             TokenSpan("--i-tabel", 30, 39),  # typo for --i-table
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=39)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         # Only action issue, no option issue because action is invalid
         assert len(issues) == 1
@@ -1113,7 +1123,7 @@ class TestValidateRequiredOptions:
             TokenSpan("summarize", 20, 29),
             TokenSpan("--help", 30, 36),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=36)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert issues == []
 
@@ -1123,7 +1133,7 @@ class TestValidateRequiredOptions:
             TokenSpan("summarize", 20, 29),
             TokenSpan("-h", 30, 32),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=32)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert issues == []
 
@@ -1138,7 +1148,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--i-metadata", 25, 38),  # valid
             TokenSpan("--i-metadat", 39, 50),  # typo (prefix of --i-metadata)
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=50)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         unknown_option_issues = [
@@ -1171,7 +1181,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--p-where", 90, 99),
             TokenSpan("--p-exclude-ids", 100, 114),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=114)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert issues == []
 
@@ -1185,7 +1195,7 @@ class TestValidateRequiredOptions:
             TokenSpan("summarize", 20, 29),
             TokenSpan("--I-TA", 30, 36),  # prefix (uppercase) of --i-table
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=36)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert len(issues) == 1
         assert "--I-TA" in issues[0].message
@@ -1205,7 +1215,7 @@ class TestValidateRequiredOptions:
             TokenSpan("table.qza", 40, 49),
             TokenSpan("--xyz123", 50, 58),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=58)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert len(issues) == 1
         assert "--xyz123" in issues[0].message
@@ -1225,7 +1235,7 @@ class TestValidateRequiredOptions:
             TokenSpan("--p-obs-metadata", 51, 67),
             TokenSpan("metadata.tsv", 68, 80),  # value, not an option
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=80)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
         assert issues == []
 
@@ -1240,7 +1250,7 @@ class TestValidateOptionsRequiredSuppression:
             TokenSpan("filter-samples", 20, 34),
             TokenSpan("--i", 35, 38),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=38)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         unknown_option_issues = [
@@ -1265,7 +1275,7 @@ class TestValidateOptionsRequiredSuppression:
             TokenSpan("summarize", 20, 29),
             TokenSpan("--xyz123", 30, 38),
         ]
-        cmd = ParsedCommand(tokens=tokens, start=0, end=38)
+        cmd = _command(tokens)
         issues = validate_command_with_hierarchy(cmd, hierarchy_with_plugins_and_builtins)
 
         unknown_option_issues = [
@@ -1280,3 +1290,63 @@ class TestValidateOptionsRequiredSuppression:
         assert len(unknown_option_issues) == 1
         assert len(missing_required_issues) == 1
         assert "--i-table" in missing_required_issues[0].message
+
+
+class TestCachedCommandValidator:
+    def test_matches_uncached_validation(
+        self, hierarchy_with_plugins_and_builtins: dict
+    ) -> None:
+        tokens = [
+            TokenSpan("qiime", 0, 5),
+            TokenSpan("featur-table", 6, 18),
+            TokenSpan("summarize", 19, 28),
+        ]
+        cmd = _command(tokens)
+        catalog = QiimeCatalog.from_hierarchy(hierarchy_with_plugins_and_builtins)
+        validate = make_cached_command_validator()
+
+        assert validate(cmd, catalog) == validate_command_with_catalog(cmd, catalog)
+
+    def test_shifted_command_reuses_cached_issues(
+        self, hierarchy_with_plugins_and_builtins: dict, mocker
+    ) -> None:
+        import q2lsp.lsp.diagnostics.validator as validator_mod
+
+        spy = mocker.spy(validator_mod, "validate_command_with_catalog")
+        catalog = QiimeCatalog.from_hierarchy(hierarchy_with_plugins_and_builtins)
+        validate = make_cached_command_validator()
+        first = ParsedCommand(
+            tokens=[TokenSpan("qiime", 0, 5), TokenSpan("featur-table", 6, 18)],
+            start=0,
+            end=18,
+        )
+        shifted = ParsedCommand(
+            tokens=[TokenSpan("qiime", 10, 15), TokenSpan("featur-table", 16, 28)],
+            start=10,
+            end=28,
+        )
+
+        first_issues = validate(first, catalog)
+        shifted_issues = validate(shifted, catalog)
+
+        assert spy.call_count == 1
+        assert [(issue.start, issue.end) for issue in first_issues] == [(6, 18)]
+        assert [(issue.start, issue.end) for issue in shifted_issues] == [(16, 28)]
+
+    def test_new_catalog_invalidates_cache(
+        self, hierarchy_with_plugins_and_builtins: dict, mocker
+    ) -> None:
+        import q2lsp.lsp.diagnostics.validator as validator_mod
+
+        spy = mocker.spy(validator_mod, "validate_command_with_catalog")
+        validate = make_cached_command_validator()
+        cmd = ParsedCommand(
+            tokens=[TokenSpan("qiime", 0, 5), TokenSpan("featur-table", 6, 18)],
+            start=0,
+            end=18,
+        )
+
+        validate(cmd, QiimeCatalog.from_hierarchy(hierarchy_with_plugins_and_builtins))
+        validate(cmd, QiimeCatalog.from_hierarchy(hierarchy_with_plugins_and_builtins))
+
+        assert spy.call_count == 2
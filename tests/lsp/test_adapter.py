@@ -13,9 +13,12 @@ from q2lsp.core.types import (
 from q2lsp.lsp.adapter import (
     LSP_POSITION_ENCODING,
     completion_kind_to_lsp,
+    make_cached_completion_items_converter,
+    make_cached_offset_mapper,
     offset_to_position,
     position_to_offset,
     to_lsp_completion_item,
+    to_lsp_completion_items,
 )
 
 
@@ -194,6 +197,60 @@ class TestOffsetToPosition:
         assert offset_to_position(doc, 4) == types.Position(line=0, character=3)
         assert offset_to_position(doc, 5) == types.Position(line=1, character=0)
 
+    def test_offset_to_position_reflects_changed_text_for_same_uri(self) -> None:
+        """Cached line tables are not reused once the document text changes."""
+        before = TextDocument(
+            uri="file:///edited.txt", source="ab\ncd", language_id="shell", version=1
+        )
+        after = TextDocument(
+            uri="file:///edited.txt", source="a\nbcd", language_id="shell", version=1
+        )
+
+        assert offset_to_position(before, 4) == types.Position(line=1, character=1)
+        assert offset_to_position(after, 4) == types.Position(line=1, character=2)
+        assert position_to_offset(before, types.Position(line=1, character=0)) == 3
+
+
+class TestMakeCachedOffsetMapper:
+    """Tests for make_cached_offset_mapper function."""
+
+    def test_reuses_mapper_for_unchanged_text(self) -> None:
+        get_offset_mapper = make_cached_offset_mapper()
+        doc = TextDocument(uri="file:///same.txt", source="ab\ncd", language_id="shell")
+
+        assert get_offset_mapper(doc) is get_offset_mapper(doc)
+
+    def test_rebuilds_mapper_when_text_changes(self) -> None:
+        get_offset_mapper = make_cached_offset_mapper()
+        before = TextDocument(
+            uri="file:///edited.txt", source="ab\ncd", language_id="shell", version=1
+        )
+        after = TextDocument(
+            uri="file:///edited.txt", source="a\nbcd", language_id="shell", version=2
+        )
+
+        get_offset_mapper(before)
+        mapper = get_offset_mapper(after)
+
+        assert offset_to_position(after, 4, mapper=mapper) == types.Position(
+            line=1, character=2
+        )
+        assert (
+            position_to_offset(
+                after, types.Position(line=1, character=0), mapper=mapper
+            )
+            == 2
+        )
+
+    def test_evicts_least_recently_used_documents(self) -> None:
+        get_offset_mapper = make_cached_offset_mapper(maxsize=1)
+        first = TextDocument(uri="file:///a.txt", source="a", language_id="shell")
+        second = TextDocument(uri="file:///b.txt", source="b", language_id="shell")
+        mapper = get_offset_mapper(first)
+        get_offset_mapper(second)
+
+        assert get_offset_mapper(first) is not mapper
+
 
 class TestCompletionKindToLsp:
     """Tests for completion_kind_to_lsp function."""
@@ -358,3 +415,87 @@ class TestToLspCompletionItem:
         assert isinstance(lsp_item.text_edit, types.TextEdit)
         assert lsp_item.text_edit.range.start == types.Position(line=0, character=6)
         assert lsp_item.text_edit.range.end == types.Position(line=0, character=9)
+
+
+class TestToLspCompletionItems:
+    """Tests for to_lsp_completion_items batch conversion."""
+
+    def test_matches_single_item_conversion(self) -> None:
+        items = [
+            InternalCompletionItem(
+                label="--i-table", detail="input", kind=CompletionKind.PARAMETER
+            ),
+            InternalCompletionItem(
+                label="sample_metadata",
+                detail="metadata",
+                kind=CompletionKind.PARAMETER,
+                insert_text="--m-sample-metadata-file",
+            ),
+        ]
+        position = types.Position(line=3, character=10)
+
+        lsp_items = to_lsp_completion_items(items, position=position, prefix="--")
+
+        assert lsp_items == [
+            to_lsp_completion_item(item, position=position, prefix="--")
+            for item in items
+        ]
+
+    def test_empty_prefix_emits_no_text_edit(self) -> None:
+        items = [
+            InternalCompletionItem(
+                label="info", detail="builtin", kind=CompletionKind.BUILTIN
+            )
+        ]
+
+        lsp_items = to_lsp_completion_items(
+            items, position=types.Position(line=0, character=6), prefix=""
+        )
+
+        assert lsp_items[0].text_edit is None
+
+
+class TestCachedCompletionItemsConverter:
+    """Tests for the per-server converter that reuses LSP completion items."""
+
+    ITEMS = (
+        InternalCompletionItem(
+            label="--i-table", detail="input", kind=CompletionKind.PARAMETER
+        ),
+        InternalCompletionItem(
+            label="--p-depth", detail="param", kind=CompletionKind.PARAMETER
+        ),
+    )
+
+    def test_matches_uncached_conversion(self) -> None:
+        convert = make_cached_completion_items_converter()
+        position = types.Position(line=2, character=8)
+
+        assert convert(self.ITEMS, position, "--") == to_lsp_completion_items(
+            self.ITEMS, position=position, prefix="--"
+        )
+        assert convert(self.ITEMS, None, "") == to_lsp_completion_items(self.ITEMS)
+
+    def test_reuses_items_for_same_replace_range(self) -> None:
+        convert = make_cached_completion_items_converter()
+        first = convert(self.ITEMS, types.Position(line=2, character=8), "--")
+        second = convert(self.ITEMS, types.Position(line=2, character=8), "--")
+
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_different_range_builds_new_items(self) -> None:
+        convert = make_cached_completion_items_converter()
+        first = convert(self.ITEMS, types.Position(line=2, character=8), "--")
+        moved = convert(self.ITEMS, types.Position(line=3, character=8), "--")
+
+        assert moved[0] is not first[0]
+        assert moved[0].text_edit is not None
+        assert isinstance(moved[0].text_edit, types.TextEdit)
+        assert moved[0].text_edit.range.start == types.Position(line=3, character=6)
+
+    def test_evicts_least_recently_used_items(self) -> None:
+        convert = make_cached_completion_items_converter(maxsize=1)
+        first = convert(self.ITEMS[:1], None, "")
+        convert(self.ITEMS[1:], None, "")
+
+        assert convert(self.ITEMS[:1], None, "")[0] is not first[0]
@@ -4,12 +4,12 @@ from __future__ import annotations
 
 from tests.helpers.cursor import extract_cursor_offset
 
+from q2lsp.core.types import CompletionMode
 from q2lsp.lsp.completion_context import (
     _determine_mode,
     _original_to_merged_offset,
     get_completion_context,
 )
-from q2lsp.lsp.types import CompletionMode
 
 
 class TestDetermineMode:
@@ -13,11 +13,10 @@ from tests.helpers.completions import (
     ctx_get_used_parameters,
 )
 
-from q2lsp.core.types import CompletionItem
+from q2lsp.core.types import CompletionItem, CompletionMode
 from q2lsp.lsp.adapter import to_lsp_completion_item
 from q2lsp.lsp.types import (
     CompletionContext,
-    CompletionMode,
     ParsedCommand,
     TokenSpan,
 )
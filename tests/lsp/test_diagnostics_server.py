@@ -6,6 +6,8 @@ Covers debounce manager behavior and diagnostic severity mapping.
 from __future__ import annotations
 
 import asyncio
+import threading
+
 import pytest
 from lsprotocol import types
 
@@ -454,3 +456,59 @@ class TestDiagnosticSeverity:
         diagnostic_range = publish_params.diagnostics[0].range
         assert diagnostic_range.start == types.Position(line=1, character=0)
         assert diagnostic_range.end == types.Position(line=1, character=13)
+
+    @pytest.mark.asyncio
+    async def test_commands_are_validated_off_the_event_loop_thread(
+        self, mock_hierarchy: CommandHierarchy, mocker
+    ) -> None:
+        """Command validation runs in a worker thread, not on the event loop."""
+        validation_threads: list[int] = []
+
+        def record_validate(_command, _catalog) -> list:
+            validation_threads.append(threading.get_ident())
+            return []
+
+        mocker.patch.object(
+            server_mod,
+            "make_cached_command_validator",
+            return_value=record_validate,
+        )
+        server = server_mod.create_server(
+            get_hierarchy=lambda: mock_hierarchy,
+            debounce_ms=0,
+        )
+        source = "qiime dummy-plugin dummy-action\nqiime dummy-plugin dummy-action"
+
+        class MockDocument:
+            def __init__(self) -> None:
+                self.uri = "file:///test.sh"
+                self.source = source
+                self.version = 1
+
+        mock_workspace = mocker.Mock()
+        mock_workspace.get_text_document.return_value = MockDocument()
+        server.protocol._workspace = mock_workspace
+
+        diagnostics_published = asyncio.Event()
+        mocker.patch.object(
+            server,
+            "text_document_publish_diagnostics",
+            autospec=True,
+            side_effect=lambda _params: diagnostics_published.set(),
+        )
+
+        did_open_handler = server.protocol.fm.features[types.TEXT_DOCUMENT_DID_OPEN]
+        await did_open_handler(
+            types.DidOpenTextDocumentParams(
+                text_document=types.TextDocumentItem(
+                    uri="file:///test.sh",
+                    language_id="shellscript",
+                    version=1,
+                    text=source,
+                )
+            )
+        )
+        await asyncio.wait_for(diagnostics_published.wait(), timeout=1)
+
+        assert len(validation_threads) == 2
+        assert threading.get_ident() not in validation_threads
@@ -6,14 +6,15 @@ import pytest
 
 from tests.helpers.cursor import extract_cursor_offset
 
+from q2lsp.core.types import CompletionMode
 from q2lsp.lsp.document_commands import (
     AnalyzedDocument,
     analyze_document,
+    make_cached_document_analyzer,
     resolve_completion_context,
     to_merged_offset,
     to_original_offset,
 )
-from q2lsp.lsp.types import CompletionMode
 
 
 class TestAnalyzeDocument:
@@ -83,10 +84,11 @@ class TestAnalyzeDocument:
         doc = analyze_document("qiime info")
         assert isinstance(doc.commands, tuple)
 
-    def test_offset_map_is_tuple(self) -> None:
-        """Offset map should be a tuple (immutable)."""
+    def test_offset_map_is_immutable(self) -> None:
+        """Offset map should be a read-only view (immutable)."""
         doc = analyze_document("qiime info")
-        assert isinstance(doc.offset_map, tuple)
+        with pytest.raises(TypeError):
+            doc.offset_map[0] = 1  # type: ignore[index]
 
 
 class TestToOriginalOffset:
@@ -286,3 +288,41 @@ class TestResolveCompletionContext:
             assert ctx_new.token_index == ctx_old.token_index, (
                 f"token_index mismatch at offset {offset}"
             )
+
+    def test_picks_command_between_other_commands(self) -> None:
+        """The command containing the cursor is found among several."""
+        text, offset = extract_cursor_offset(
+            text_with_cursor="qiime info; echo x; qiime tools im<CURSOR>p; qiime dev"
+        )
+        doc = analyze_document(text)
+        ctx = resolve_completion_context(doc, offset)
+        assert ctx.mode == CompletionMode.PLUGIN
+        assert ctx.prefix == "im"
+        assert ctx.command is not None
+        assert ctx.command.tokens[1].text == "tools"
+
+
+class TestCachedDocumentAnalyzer:
+    """Tests for make_cached_document_analyzer."""
+
+    def test_reuses_analysis_for_unchanged_source(self) -> None:
+        analyze = make_cached_document_analyzer()
+
+        first = analyze("file:///a.sh", "qiime info")
+
+        assert analyze("file:///a.sh", "qiime info") is first
+
+    def test_reanalyzes_changed_source(self) -> None:
+        analyze = make_cached_document_analyzer()
+        analyze("file:///a.sh", "qiime info")
+
+        doc = analyze("file:///a.sh", "qiime tools")
+
+        assert doc.commands[0].tokens[1].text == "tools"
+
+    def test_evicts_least_recently_used_document(self) -> None:
+        analyze = make_cached_document_analyzer(maxsize=1)
+        first = analyze("file:///a.sh", "qiime info")
+        analyze("file:///b.sh", "qiime info")
+
+        assert analyze("file:///a.sh", "qiime info") is not first
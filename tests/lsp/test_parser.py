@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from tests.helpers.cursor import extract_cursor_offset
 
+from q2lsp.core.types import CompletionMode
 from q2lsp.lsp.parser import (
     merge_line_continuations,
     tokenize_shell_line,
@@ -11,7 +12,6 @@ from q2lsp.lsp.parser import (
     command_at_position,
     get_completion_context,
 )
-from q2lsp.lsp.types import CompletionMode
 
 
 class TestMergeLineContinuations:
@@ -76,11 +76,22 @@ class TestTokenizeShellLine:
         tokens = tokenize_shell_line(r'qiime "hello\"world"', 0)
         assert tokens[1].text == 'hello"world'
 
+    def test_double_quotes_trailing_backslash_is_literal(self) -> None:
+        tokens = tokenize_shell_line('qiime "a\\\\b\\', 0)
+        assert tokens[1].text == "a\\b\\"
+        assert tokens[1].end == len('qiime "a\\\\b\\')
+
     def test_unquoted_escape(self) -> None:
         tokens = tokenize_shell_line(r"qiime\ info", 0)
         assert len(tokens) == 1
         assert tokens[0].text == "qiime info"
 
+    def test_plain_runs_join_quoted_and_escaped_parts(self) -> None:
+        line = "qiime ab'c d'ef\"g h\"i\\ j k\\"
+        tokens = tokenize_shell_line(line, 0)
+        assert [token.text for token in tokens] == ["qiime", "abc defg hi j", "k\\"]
+        assert tokens[2].end == len(line)
+
     def test_with_offset(self) -> None:
         tokens = tokenize_shell_line("qiime info", 10)
         assert tokens[0].start == 10
@@ -135,11 +146,33 @@ class TestFindQiimeCommands:
             ("--help", 20, 26),
         ]
 
+    def test_single_command_without_separators_preserves_spans(self) -> None:
+        cmds = find_qiime_commands("  qiime info --help ")
+        assert len(cmds) == 1
+        assert (cmds[0].start, cmds[0].end) == (2, 20)
+        assert [(token.text, token.start, token.end) for token in cmds[0].tokens] == [
+            ("qiime", 2, 7),
+            ("info", 8, 12),
+            ("--help", 13, 19),
+        ]
+
+    def test_command_tokens_are_immutable_tuple(self) -> None:
+        cmds = find_qiime_commands("qiime info")
+        assert cmds[0].tokens == (("qiime", 0, 5), ("info", 6, 10))
+        assert isinstance(cmds[0].tokens, tuple)
+
+    def test_empty_text_has_no_commands(self) -> None:
+        assert find_qiime_commands("") == []
+
     def test_newline_separated_qiime_command(self) -> None:
         cmds = find_qiime_commands("echo hi\nqiime info")
         assert len(cmds) == 1
         assert cmds[0].start == 8
 
+    def test_quoted_or_escaped_qiime_word_is_still_detected(self) -> None:
+        cmds = find_qiime_commands("cd x; 'qiime' info; q\\iime tools; qiimex info")
+        assert [cmd.tokens[1].text for cmd in cmds] == ["info", "tools"]
+
     def test_separators_inside_double_quotes_are_not_split(self) -> None:
         cmds = find_qiime_commands('qiime tools import --input-path "a;b|c&&d||e"')
         assert len(cmds) == 1
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 
 import pytest
 from lsprotocol import types
 
 import q2lsp.lsp.server as server_mod
+from q2lsp.core.types import CompletionItem, CompletionKind
 from q2lsp.qiime.catalog import QiimeCatalog
 from q2lsp.qiime.types import CommandHierarchy
+from q2lsp.usecases.get_completions_usecase import (
+    get_completions,
+    make_cached_completions,
+)
 
 
 class TestCreateServer:
@@ -55,6 +61,12 @@ class TestCreateServer:
                 },
             }
         }
+        mock_get_completions = mocker.create_autospec(get_completions, return_value=[])
+        mocker.patch.object(
+            server_mod,
+            "make_cached_completions",
+            return_value=mock_get_completions,
+        )
         server = server_mod.create_server(get_hierarchy=lambda: hierarchy)
 
         class MockDocument:
@@ -66,13 +78,6 @@ class TestCreateServer:
         mock_workspace.get_text_document.return_value = MockDocument()
         server.protocol._workspace = mock_workspace
 
-        mock_get_completions = mocker.patch.object(
-            server_mod,
-            "get_completions",
-            autospec=True,
-            return_value=[],
-        )
-
         completion_handler = server.protocol.fm.features[types.TEXT_DOCUMENT_COMPLETION]
         params = types.CompletionParams(
             text_document=types.TextDocumentIdentifier(uri="file:///test.sh"),
@@ -147,6 +152,21 @@ class TestCreateServer:
         assert "QIIME root help" in hover.contents.value
         assert calls == 1
 
+    def test_warm_catalog_builds_hierarchy_in_background_thread(self) -> None:
+        """warm_catalog=True requests the hierarchy off the calling thread."""
+        built = threading.Event()
+        builder_threads: list[str] = []
+
+        def get_hierarchy() -> CommandHierarchy:
+            builder_threads.append(threading.current_thread().name)
+            built.set()
+            return {"qiime": {"builtins": []}}
+
+        server_mod.create_server(get_hierarchy=get_hierarchy, warm_catalog=True)
+
+        assert built.wait(timeout=5)
+        assert builder_threads == ["q2lsp-catalog-warm"]
+
     def test_completion_text_edit_replaces_partial_prefix_only(self, mocker) -> None:
         """Completing "qiime fea" replaces only "fea" with the candidate."""
         hierarchy: CommandHierarchy = {
@@ -190,6 +210,82 @@ class TestCreateServer:
             end=types.Position(line=0, character=9),
         )
 
+    def test_completion_truncates_large_result_sets(self, mocker) -> None:
+        """Results beyond MAX_COMPLETION_ITEMS are dropped and marked incomplete."""
+        internal_items = [
+            CompletionItem(label=f"plugin-{i}", detail="", kind=CompletionKind.PLUGIN)
+            for i in range(server_mod.MAX_COMPLETION_ITEMS + 1)
+        ]
+        mocker.patch.object(
+            server_mod,
+            "make_cached_completions",
+            return_value=mocker.create_autospec(
+                get_completions, return_value=internal_items
+            ),
+        )
+        server = server_mod.create_server(get_hierarchy=lambda: {"plugins": {}})
+
+        class MockDocument:
+            uri = "file:///test.sh"
+            source = "qiime "
+            version = 1
+
+        mock_workspace = mocker.Mock()
+        mock_workspace.get_text_document.return_value = MockDocument()
+        server.protocol._workspace = mock_workspace
+
+        completion_handler = server.protocol.fm.features[types.TEXT_DOCUMENT_COMPLETION]
+        completion = completion_handler(
+            types.CompletionParams(
+                text_document=types.TextDocumentIdentifier(uri="file:///test.sh"),
+                position=types.Position(line=0, character=6),
+            )
+        )
+
+        assert completion.is_incomplete is True
+        assert len(completion.items) == server_mod.MAX_COMPLETION_ITEMS
+
+    def test_completion_reuses_empty_prefix_root_response(self, mocker) -> None:
+        """Empty-prefix root completion is computed once per catalog."""
+        hierarchy: CommandHierarchy = {
+            "qiime": {
+                "name": "qiime",
+                "builtins": [],
+                "feature-table": {
+                    "name": "feature-table",
+                    "short_description": "Feature table plugin",
+                },
+            }
+        }
+        get_completions_spy = mocker.Mock(wraps=make_cached_completions())
+        mocker.patch.object(
+            server_mod,
+            "make_cached_completions",
+            return_value=get_completions_spy,
+        )
+        server = server_mod.create_server(get_hierarchy=lambda: hierarchy)
+
+        class MockDocument:
+            uri = "file:///test.sh"
+            source = "qiime "
+            version = 1
+
+        mock_workspace = mocker.Mock()
+        mock_workspace.get_text_document.return_value = MockDocument()
+        server.protocol._workspace = mock_workspace
+
+        completion_handler = server.protocol.fm.features[types.TEXT_DOCUMENT_COMPLETION]
+        params = types.CompletionParams(
+            text_document=types.TextDocumentIdentifier(uri="file:///test.sh"),
+            position=types.Position(line=0, character=6),
+        )
+        completions = [completion_handler(params), completion_handler(params)]
+
+        assert get_completions_spy.call_count == 1
+        assert completions[0] == completions[1]
+        assert [item.label for item in completions[1].items] == ["feature-table"]
+        assert completions[1].items[0].text_edit is None
+
     def test_completion_returns_empty_list_on_handler_failure(self, mocker) -> None:
         """Completion handler failures return the default empty list."""
         server = server_mod.create_server(get_hierarchy=lambda: {"plugins": {}})
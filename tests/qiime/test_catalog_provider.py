@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from q2lsp.qiime.catalog import QiimeCatalog, make_catalog_provider
 from q2lsp.qiime.types import CommandHierarchy
 
@@ -33,3 +36,24 @@ def test_catalog_provider_builds_catalog_once() -> None:
     assert catalog_1.builtin_names == ("info",)
     assert catalog_1.command_names == ("info", "feature-table")
     assert catalog_1.is_builtin("info") is True
+
+
+def test_catalog_provider_builds_once_under_concurrent_calls() -> None:
+    hierarchy_calls = 0
+    release = threading.Event()
+
+    def get_hierarchy() -> CommandHierarchy:
+        nonlocal hierarchy_calls
+        hierarchy_calls += 1
+        release.wait(timeout=5)
+        return {"qiime": {"builtins": []}}
+
+    provider = make_catalog_provider(get_hierarchy)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(provider) for _ in range(4)]
+        release.set()
+        catalogs = [future.result() for future in futures]
+
+    assert hierarchy_calls == 1
+    assert all(catalog is catalogs[0] for catalog in catalogs)
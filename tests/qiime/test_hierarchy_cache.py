@@ -0,0 +1,182 @@
+"""Tests for the persistent hierarchy cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from q2lsp.qiime import hierarchy_cache
+from q2lsp.qiime import hierarchy_provider as hp_module
+from q2lsp.qiime.hierarchy_cache import (
+    hierarchy_cache_path,
+    load_cached_hierarchy,
+    store_cached_hierarchy,
+)
+from q2lsp.qiime.types import CommandHierarchy
+
+
+@pytest.fixture
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
+
+
+def test_cache_path_is_under_xdg_cache_home(cache_home: Path) -> None:
+    path = hierarchy_cache_path()
+
+    assert path.parent == cache_home / "q2lsp"
+    assert path.name.startswith("hierarchy-")
+    assert path.suffix == ".json"
+
+
+def test_cache_path_changes_with_installed_distributions(
+    cache_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    before = hierarchy_cache_path()
+    monkeypatch.setattr(
+        hierarchy_cache, "_installed_distributions_key", lambda: "other"
+    )
+
+    assert hierarchy_cache_path() != before
+
+
+def _write_dist_info(
+    site: Path, directory: str, name: str, version: str, entry_points: str = ""
+) -> None:
+    dist_info = site / directory
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+    )
+    if entry_points:
+        (dist_info / "entry_points.txt").write_text(entry_points)
+
+
+def test_distributions_key_tracks_qiime_packages_only(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    site = tmp_path / "site"
+    site.mkdir()
+    monkeypatch.syspath_prepend(str(site))
+    before = hierarchy_cache._installed_distributions_key()
+
+    _write_dist_info(site, "requests-2.0.0.dist-info", "requests", "2.0.0")
+    assert hierarchy_cache._installed_distributions_key() == before
+
+    _write_dist_info(site, "q2_types-2024.5.0.dist-info", "q2-types", "2024.5.0")
+    assert hierarchy_cache._installed_distributions_key() != before
+
+
+def test_distributions_key_tracks_plugins_registered_by_entry_point(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    site = tmp_path / "site"
+    site.mkdir()
+    monkeypatch.syspath_prepend(str(site))
+    before = hierarchy_cache._installed_distributions_key()
+
+    _write_dist_info(
+        site,
+        "pytest_plugin-1.0.dist-info",
+        "pytest-plugin",
+        "1.0",
+        entry_points="[pytest11]\nplugin = pytest_plugin\n",
+    )
+    assert hierarchy_cache._installed_distributions_key() == before
+
+    _write_dist_info(
+        site,
+        "gemelli-0.0.10.dist-info",
+        "gemelli",
+        "0.0.10",
+        entry_points="[qiime2.plugins]\ngemelli = gemelli.q2.plugin_setup:plugin\n",
+    )
+    assert hierarchy_cache._installed_distributions_key() != before
+
+
+def test_distributions_key_tracks_reinstall_at_same_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    site = tmp_path / "site"
+    site.mkdir()
+    monkeypatch.syspath_prepend(str(site))
+    _write_dist_info(site, "q2_types-2024.5.0.dist-info", "q2-types", "2024.5.0")
+    before = hierarchy_cache._installed_distributions_key()
+
+    os.utime(site / "q2_types-2024.5.0.dist-info", ns=(0, 0))
+    assert hierarchy_cache._installed_distributions_key() != before
+
+
+def test_distributions_key_tracks_schema_and_q2lsp_versions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    before = hierarchy_cache._installed_distributions_key()
+
+    monkeypatch.setattr(hierarchy_cache, "_HIERARCHY_CACHE_SCHEMA_VERSION", 2)
+    schema_bumped = hierarchy_cache._installed_distributions_key()
+    assert schema_bumped != before
+
+    monkeypatch.setattr(hierarchy_cache, "_q2lsp_version", lambda: "99.0.0")
+    assert hierarchy_cache._installed_distributions_key() != schema_bumped
+
+
+def test_store_then_load_round_trips(cache_home: Path) -> None:
+    path = cache_home / "q2lsp" / "hierarchy-test.json"
+    hierarchy: CommandHierarchy = {"qiime": {"name": "qiime", "builtins": ["info"]}}
+
+    store_cached_hierarchy(path, hierarchy)
+
+    assert load_cached_hierarchy(path) == hierarchy
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_stdlib_json_fallback_reads_files_written_with_orjson(
+    cache_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = cache_home / "hierarchy.json"
+    hierarchy: CommandHierarchy = {"qiime": {"name": "qiime", "help": "Ünïcode"}}
+    store_cached_hierarchy(path, hierarchy)
+
+    monkeypatch.setattr(hierarchy_cache, "_orjson", None)
+
+    assert load_cached_hierarchy(path) == hierarchy
+    store_cached_hierarchy(path, hierarchy)
+    assert load_cached_hierarchy(path) == hierarchy
+
+
+def test_load_missing_cache_returns_none(cache_home: Path) -> None:
+    assert load_cached_hierarchy(cache_home / "missing.json") is None
+
+
+@pytest.mark.parametrize("content", ["{not json", "[]", '{"qiime": 1}'])
+def test_load_ignores_corrupt_cache(cache_home: Path, content: str) -> None:
+    path = cache_home / "hierarchy.json"
+    path.write_text(content, encoding="utf-8")
+
+    assert load_cached_hierarchy(path) is None
+
+
+def test_build_qiime_hierarchy_uses_stored_hierarchy(cache_home: Path) -> None:
+    hierarchy: CommandHierarchy = {"qiime": {"name": "qiime", "builtins": []}}
+    store_cached_hierarchy(hierarchy_cache_path(), hierarchy)
+
+    assert hp_module.build_qiime_hierarchy() == hierarchy
+
+
+def test_build_qiime_hierarchy_skips_cache_when_disabled(
+    cache_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    stored: CommandHierarchy = {"qiime": {"name": "qiime", "builtins": []}}
+    fresh: CommandHierarchy = {"qiime": {"name": "qiime", "builtins": ["info"]}}
+    store_cached_hierarchy(hierarchy_cache_path(), stored)
+    monkeypatch.setattr(
+        "q2lsp.qiime.q2cli_gateway.build_qiime_hierarchy", lambda: fresh
+    )
+    monkeypatch.setenv("Q2LSP_NO_HIERARCHY_CACHE", "1")
+
+    assert hp_module.build_qiime_hierarchy() == fresh
+
+    monkeypatch.delenv("Q2LSP_NO_HIERARCHY_CACHE")
+    assert load_cached_hierarchy(hierarchy_cache_path()) == stored
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from q2lsp.qiime.options import (
+    OptionGroup,
     format_qiime_option_label,
+    group_option_tokens,
     normalize_option_to_param_name,
     option_label_matches_prefix,
     param_is_required,
@@ -67,6 +69,12 @@ class TestQiimeOptionPrefix:
         param: JsonObject = {"signature_type": "input_data"}
         assert qiime_option_prefix(param) == "i"
 
+    def test_signature_type_sharing_only_the_initial_has_no_prefix(self) -> None:
+        """Kinds must start with the full known kind, not just its first letter."""
+        for signature_type in ("integer", "m", "plugin", ""):
+            param: JsonObject = {"signature_type": signature_type}
+            assert qiime_option_prefix(param) == ""
+
     def test_unknown_type(self) -> None:
         """Unknown type returns empty prefix."""
         param: JsonObject = {"type": "unknown"}
@@ -140,6 +148,27 @@ class TestFormatQiimeOptionLabel:
         assert format_qiime_option_label("m", "input") == "--m-input"
 
 
+class TestGroupOptionTokens:
+    def test_groups_values_and_inline_values(self) -> None:
+        tokens = ["qiime", "--i-table", "t.qza", "--p-depth=10", "--verbose"]
+
+        assert group_option_tokens(tokens, str, start_index=1) == (
+            OptionGroup(
+                token="--i-table", option_text="--i-table", value_tokens=("t.qza",)
+            ),
+            OptionGroup(
+                token="--p-depth=10", option_text="--p-depth", inline_value="10"
+            ),
+            OptionGroup(token="--verbose", option_text="--verbose"),
+        )
+
+    def test_option_groups_have_no_instance_dict(self) -> None:
+        """Groups are built per option token, so they use slots."""
+        group = OptionGroup(token="--verbose", option_text="--verbose")
+
+        assert not hasattr(group, "__dict__")
+
+
 class TestNormalizeOptionToParamName:
     def test_standard_option(self) -> None:
         assert normalize_option_to_param_name("--i-table") == "table"
@@ -350,3 +379,9 @@ class TestQiimeSignatureKind:
     def test_unknown_signature_type_is_returned_lowercase(self) -> None:
         """signature_type is trusted even when it is not a known SDK kind."""
         assert qiime_signature_kind({"signature_type": "Unknown"}) == "unknown"
+
+    def test_multi_letter_head_is_not_a_qiime_prefix(self) -> None:
+        assert normalize_option_to_param_name("--in-place") == "in_place"
+
+    def test_value_after_equals_is_ignored(self) -> None:
+        assert normalize_option_to_param_name("--p-x=--i-table") == "x"
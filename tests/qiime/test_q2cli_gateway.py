@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from typing import cast
 
 import click
@@ -26,6 +28,50 @@ class TestQ2CliGatewayPublicSurface:
         assert "PluginCommand" not in q2cli_gateway.__all__
         assert "click" not in q2cli_gateway.__all__
 
+    def test_package_reexports_gateway_builders(self) -> None:
+        import q2lsp.qiime as qiime_package
+
+        assert qiime_package.build_qiime_catalog is q2cli_gateway.build_qiime_catalog
+        assert (
+            qiime_package.build_qiime_hierarchy is q2cli_gateway.build_qiime_hierarchy
+        )
+
+    def test_submodule_import_does_not_load_gateway(self) -> None:
+        command = (
+            "import sys\n"
+            "import q2lsp.qiime.options, q2lsp.qiime.catalog\n"
+            "assert 'q2lsp.qiime.q2cli_gateway' not in sys.modules\n"
+            "assert 'click' not in sys.modules\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", command],
+            capture_output=True,
+            check=False,
+            text=True,
+            timeout=10,
+        )
+
+        assert result.returncode == 0, result.stderr
+
+    def test_gateway_import_defers_q2cli_commands(self) -> None:
+        command = (
+            "import sys\n"
+            "from q2lsp.qiime.q2cli_gateway import create_qiime_help_provider\n"
+            "create_qiime_help_provider()\n"
+            "assert 'q2cli.commands' not in sys.modules\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", command],
+            capture_output=True,
+            check=False,
+            text=True,
+            timeout=10,
+        )
+
+        assert result.returncode == 0, result.stderr
+
     def test_legacy_root_taking_helpers_are_not_public(self) -> None:
         assert not hasattr(q2cli_gateway, "build_command_hierarchy")
         assert not hasattr(q2cli_gateway, "command_hierarchy_json")
@@ -76,7 +122,7 @@ class TestBuildQiimeHierarchy:
                 }
                 self._plugin_lookup = {}
 
-        monkeypatch.setattr("q2lsp.qiime.q2cli_gateway._RootCommand", FakeRoot)
+        monkeypatch.setattr("q2cli.commands.RootCommand", FakeRoot)
 
         hierarchy = build_qiime_hierarchy()
 
@@ -97,6 +143,41 @@ class TestBuildQiimeHierarchy:
         assert params_by_name["verbose"]["default"] is False
         assert params_by_name["verbose"]["is_bool_flag"] is True
 
+    def test_build_hierarchy_merges_plugin_and_hidden_actions(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Plugin nodes hold plugin properties followed by visible and hidden actions."""
+
+        class FakeRoot(click.MultiCommand):
+            def __init__(self) -> None:
+                super().__init__(name="qiime", help="Fake QIIME root")
+                self._builtin_commands = {}
+                self._plugin_lookup = {
+                    "demux": {"id": "demux", "name": "demux", "version": "1"}
+                }
+
+        class FakePluginCommand:
+            def __init__(self) -> None:
+                self._action_lookup = {
+                    "emp-single": {"id": "emp_single", "name": "emp-single"},
+                    "summarize": {"id": "summarize", "name": "summarize"},
+                }
+                self._hidden_actions = {
+                    "summarize": {"id": "summarize", "name": "hidden"}
+                }
+
+        monkeypatch.setattr("q2cli.commands.RootCommand", FakeRoot)
+        monkeypatch.setattr(
+            "q2lsp.qiime.q2cli_gateway._get_plugin_command",
+            lambda root, ctx, plugin_name: FakePluginCommand(),
+        )
+
+        hierarchy = build_qiime_hierarchy()
+
+        demux_entry = cast(JsonObject, cast(JsonObject, hierarchy["qiime"])["demux"])
+        assert list(demux_entry) == ["id", "name", "version", "emp-single", "summarize"]
+        assert demux_entry["summarize"] == {"id": "summarize", "name": "hidden"}
+
 
 class TestCreateQiimeHelpProvider:
     """Tests for create_qiime_help_provider function."""
@@ -512,3 +593,86 @@ class TestCreateQiimeHelpProvider:
         assert "\x00" not in help_text
         # Preserve newlines and tabs
         assert "\n" in help_text
+
+    def test_provider_renders_each_command_path_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Repeated hovers on the same path reuse the rendered help text."""
+        render_calls: list[str] = []
+
+        class CountingCommand(click.Command):
+            def get_help(self, ctx: click.Context) -> str:
+                render_calls.append(ctx.info_name or "")
+                return "Usage: qiime info\r\n"
+
+        root = click.Group("qiime")
+        root.add_command(CountingCommand("info"))
+        monkeypatch.setattr(
+            "q2lsp.qiime.q2cli_gateway._get_root_command",
+            lambda: root,
+        )
+
+        provider = create_qiime_help_provider(max_content_width=80, color=False)
+
+        assert provider(["info"]) == "Usage: qiime info\n"
+        assert provider(["info"]) == "Usage: qiime info\n"
+        assert provider(["missing"]) is None
+        assert render_calls == ["info"]
+
+    def test_provider_resolves_each_group_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Hovering different actions of one plugin reuses the resolved group."""
+        lookups: list[str] = []
+
+        class CountingGroup(click.Group):
+            def get_command(
+                self, ctx: click.Context, cmd_name: str
+            ) -> click.Command | None:
+                lookups.append(cmd_name)
+                return super().get_command(ctx, cmd_name)
+
+        plugin = click.Group("feature-table")
+        plugin.add_command(click.Command("summarize", help="Summarize."))
+        plugin.add_command(click.Command("merge", help="Merge."))
+        root = CountingGroup("qiime")
+        root.add_command(plugin)
+        monkeypatch.setattr(
+            "q2lsp.qiime.q2cli_gateway._get_root_command",
+            lambda: root,
+        )
+
+        provider = create_qiime_help_provider(max_content_width=80, color=False)
+        summarize_help = provider(["feature-table", "summarize"])
+        merge_help = provider(["feature-table", "merge"])
+
+        assert summarize_help is not None
+        assert "Usage: qiime feature-table summarize" in summarize_help
+        assert merge_help is not None
+        assert "Merge." in merge_help
+        assert lookups == ["feature-table"]
+
+    def test_provider_shares_root_context_between_renders(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Different command paths hang off one lazily built root context."""
+        root = click.Group("qiime")
+        root.add_command(click.Command("info", help="Info."))
+        root.add_command(click.Command("tools", help="Tools."))
+        root_lookups: list[click.Group] = []
+
+        def get_root() -> click.Group:
+            root_lookups.append(root)
+            return root
+
+        monkeypatch.setattr("q2lsp.qiime.q2cli_gateway._get_root_command", get_root)
+
+        provider = create_qiime_help_provider(max_content_width=80, color=False)
+        info_help = provider(["info"])
+        tools_help = provider(["tools"])
+
+        assert info_help is not None
+        assert "Usage: qiime info" in info_help
+        assert tools_help is not None
+        assert "Usage: qiime tools" in tools_help
+        assert len(root_lookups) == 1
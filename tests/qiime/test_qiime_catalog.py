@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import sys
+from collections.abc import Mapping
+
 import pytest
 
 from q2lsp.qiime.catalog import QiimeCatalog
@@ -129,7 +132,9 @@ def test_qiime_catalog_accessors_handle_absent_root() -> None:
     catalog = QiimeCatalog.from_hierarchy({})
 
     assert catalog.root_node() is None
+    assert catalog.has_root_node() is False
     assert catalog.command_node("info") is None
+    assert catalog.has_command_node("info") is False
     assert catalog.action_node("feature-table", "summarize") is None
     assert catalog.builtin_names == ()
     assert catalog.command_names == ()
@@ -146,7 +151,9 @@ def test_qiime_catalog_accessors_handle_empty_root() -> None:
     catalog = QiimeCatalog.from_hierarchy({"qiime": {}})
 
     assert catalog.root_node() == {}
+    assert catalog.has_root_node() is True
     assert catalog.command_node("info") is None
+    assert catalog.has_command_node("info") is False
     assert catalog.action_node("feature-table", "summarize") is None
     assert catalog.builtin_names == ()
     assert catalog.command_names == ()
@@ -171,6 +178,29 @@ def test_qiime_catalog_returns_valid_plugins_and_builtins() -> None:
     assert catalog.valid_plugins_and_builtins() == ({"feature-table"}, {"info"})
 
 
+def test_qiime_catalog_valid_root_command_names_are_sorted_owned_copies() -> None:
+    hierarchy: CommandHierarchy = {
+        "qiime": {
+            "builtins": ["tools", "info"],
+            "tools": {"type": "builtin"},
+            "info": {"type": "builtin"},
+            "feature-table": {"description": "Feature table operations"},
+            "diversity": {"description": "Diversity analyses"},
+        }
+    }
+
+    catalog = QiimeCatalog.from_hierarchy(hierarchy)
+    first = catalog.valid_root_command_names()
+    first.clear()
+
+    assert catalog.valid_root_command_names() == [
+        "diversity",
+        "feature-table",
+        "info",
+        "tools",
+    ]
+
+
 def test_qiime_catalog_returns_valid_actions_for_command() -> None:
     hierarchy: CommandHierarchy = {
         "qiime": {
@@ -188,6 +218,28 @@ def test_qiime_catalog_returns_valid_actions_for_command() -> None:
     catalog = QiimeCatalog.from_hierarchy(hierarchy)
 
     assert catalog.valid_actions("feature-table") == ["summarize"]
+    assert catalog.has_command_node("feature-table") is True
+    assert catalog.has_command_node("builtins") is False
+
+
+def test_qiime_catalog_valid_actions_are_owned_copies_of_memoized_names() -> None:
+    hierarchy: CommandHierarchy = {
+        "qiime": {
+            "builtins": [],
+            "feature-table": {
+                "description": "Feature table operations",
+                "summarize": {"description": "Summarize feature table"},
+                "filter-samples": {"description": "Filter samples"},
+            },
+        }
+    }
+
+    catalog = QiimeCatalog.from_hierarchy(hierarchy)
+    first = catalog.valid_actions("feature-table")
+    first.clear()
+
+    assert catalog.valid_actions("feature-table") == ["summarize", "filter-samples"]
+    assert catalog.valid_actions("missing") == []
 
 
 def test_qiime_catalog_matches_builtin_leaf_semantics() -> None:
@@ -268,3 +320,53 @@ def test_qiime_catalog_help_accessors_use_fallback_precedence() -> None:
     assert catalog.command_help("feature-table") == "Feature table description"
     assert catalog.action_help("feature-table", "summarize") is None
     assert catalog.action_help("feature-table", "tabulate") == "Tabulate description"
+
+
+def test_qiime_catalog_action_signature_packs_parameter_columns() -> None:
+    hierarchy: CommandHierarchy = {
+        "qiime": {
+            "builtins": [],
+            "feature-table": {
+                "summarize": {
+                    "signature": [
+                        {"name": "table", "type": "input", "description": ""},
+                        {
+                            "name": "verbose",
+                            "type": "parameter",
+                            "description": "",
+                            "default": False,
+                            "is_bool_flag": True,
+                        },
+                        {"name": "visualization", "type": "output", "description": ""},
+                    ]
+                }
+            },
+        }
+    }
+    catalog = QiimeCatalog.from_hierarchy(hierarchy)
+
+    signature = catalog.action_signature("feature-table", "summarize")
+
+    assert signature is not None
+    assert signature.param_names == ("table", "verbose", "visualization")
+    assert signature.option_labels == ("--i-table", "--p-verbose", "--o-visualization")
+    assert signature.required_mask == 0b101
+    assert signature.bool_flag_mask == 0b010
+    assert catalog.action_signature("feature-table", "summarize") is signature
+    assert catalog.action_signature("feature-table", "missing") is None
+
+
+def test_qiime_catalog_interns_node_keys() -> None:
+    # Built at runtime so the key is not the compiler's interned constant.
+    action_prefix = "summa"
+    action_name = f"{action_prefix}rize"
+    hierarchy: CommandHierarchy = {
+        "qiime": {"builtins": [], "feature-table": {action_name: {"name": "x"}}}
+    }
+
+    catalog = QiimeCatalog.from_hierarchy(hierarchy)
+
+    feature_table = catalog.hierarchy["qiime"]["feature-table"]
+    assert isinstance(feature_table, Mapping)
+    (stored_name,) = feature_table
+    assert stored_name is sys.intern("summarize")
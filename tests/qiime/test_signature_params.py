@@ -0,0 +1,63 @@
+"""Tests for signature parameter helpers."""
+
+from __future__ import annotations
+
+from q2lsp.qiime.signature_params import (
+    build_action_signature,
+    get_all_option_labels,
+    get_required_option_labels,
+)
+from q2lsp.qiime.types import JsonObject
+
+
+def _action_node() -> JsonObject:
+    return {
+        "signature": [
+            {"name": "table", "signature_type": "input"},
+            {"name": "sampling_depth", "signature_type": "parameter", "default": 10},
+            {"name": "verbose", "type": "boolean", "is_bool_flag": True},
+        ]
+    }
+
+
+class TestOptionLabels:
+    """Tests for option label helpers built on the action signature."""
+
+    def test_all_and_required_labels(self) -> None:
+        action_node = _action_node()
+
+        assert get_all_option_labels(action_node) == [
+            "--i-table",
+            "--p-sampling-depth",
+            "--verbose",
+        ]
+        assert get_required_option_labels(action_node) == ["--i-table"]
+
+    def test_returned_lists_are_owned_by_the_caller(self) -> None:
+        action_node = _action_node()
+        get_all_option_labels(action_node).clear()
+
+        assert len(get_all_option_labels(action_node)) == 3
+
+    def test_folded_labels_are_lowercased_option_labels(self) -> None:
+        action_node: JsonObject = {
+            "signature": [{"name": "Metadata_File", "signature_type": "metadata"}]
+        }
+        signature = build_action_signature(action_node)
+
+        assert signature.option_labels == ("--m-Metadata-File",)
+        assert signature.folded_option_labels == frozenset({"--m-metadata-file"})
+
+    def test_required_param_options_pair_folded_names_with_labels(self) -> None:
+        action_node: JsonObject = {
+            "signature": [
+                {"name": "Table", "signature_type": "input"},
+                {"name": "depth", "signature_type": "parameter", "default": 1},
+                {"name": "metadata_file", "signature_type": "metadata"},
+            ]
+        }
+
+        assert build_action_signature(action_node).required_param_options == (
+            ("table", "--i-Table"),
+            ("metadata_file", "--m-metadata-file"),
+        )
@@ -10,6 +10,7 @@ from q2lsp.qiime.types import CommandHierarchy
 from q2lsp.usecases.get_completions_usecase import (
     CompletionRequest,
     get_completions,
+    make_cached_completions,
 )
 
 
@@ -257,3 +258,66 @@ def test_usecase_completion_baseline(
     items = get_completions(req, QiimeCatalog.from_hierarchy(hierarchy))
 
     assert [item.label for item in items] == expected_labels
+
+
+def test_usecase_reuses_completion_data_for_same_catalog(
+    completion_hierarchy: CommandHierarchy, mocker
+) -> None:
+    import q2lsp.usecases.get_completions_usecase as usecase_mod
+
+    spy = mocker.spy(usecase_mod, "to_completion_data")
+    complete = make_cached_completions()
+    catalog = QiimeCatalog.from_hierarchy(completion_hierarchy)
+    request = CompletionRequest(mode="root", prefix="", command_tokens=("qiime",))
+
+    first = complete(request, catalog)
+    second = complete(request, catalog)
+    complete(request, QiimeCatalog.from_hierarchy(completion_hierarchy))
+
+    assert first == second
+    assert first == get_completions(request, catalog)
+    assert spy.call_count == 3
+
+
+def test_cached_completions_do_not_share_data_between_instances(
+    completion_hierarchy: CommandHierarchy, mocker
+) -> None:
+    import q2lsp.usecases.get_completions_usecase as usecase_mod
+
+    spy = mocker.spy(usecase_mod, "to_completion_data")
+    catalog = QiimeCatalog.from_hierarchy(completion_hierarchy)
+    request = CompletionRequest(mode="root", prefix="", command_tokens=("qiime",))
+
+    make_cached_completions()(request, catalog)
+    make_cached_completions()(request, catalog)
+
+    assert spy.call_count == 2
+
+
+def test_usecase_parent_path_cache_filters_each_prefix(
+    completion_hierarchy: CommandHierarchy,
+) -> None:
+    complete = make_cached_completions()
+    catalog = QiimeCatalog.from_hierarchy(completion_hierarchy)
+    tokens = ("qiime", "feature-table", "summarize")
+
+    labels_by_prefix = {
+        prefix: [
+            item.label
+            for item in complete(
+                CompletionRequest(
+                    mode="parameter", prefix=prefix, command_tokens=tokens
+                ),
+                catalog,
+            )
+        ]
+        for prefix in ("", "--", "--o", "--i-t", "--x")
+    }
+
+    assert labels_by_prefix == {
+        "": ["--i-table", "--o-output-dir", "--help"],
+        "--": ["--i-table", "--o-output-dir", "--help"],
+        "--o": ["--o-output-dir"],
+        "--i-t": ["--i-table"],
+        "--x": [],
+    }